@@ -2,6 +2,9 @@
 # Single source of truth for all constants, credentials, endpoints, and mappings.
 # Nothing else in the codebase should hardcode these values.
 
+import sys
+from types import MappingProxyType
+
 # ── Risk / sizing ─────────────────────────────────────────────────────────────
 BANKROLL     = 288.0
 USE_MAKER    = True
@@ -17,6 +20,7 @@ DRY_RUN = True         # set False to place real orders
 KALSHI_HOST   = "https://api.elections.kalshi.com/trade-api/v2"
 KALSHI_KEY_ID = "d54b907a-4532-4e6c-926b-998d1a82c5ed"
 KALSHI_PEM    = "/Users/dbrown/Development/stuart/rusty.pem"
+KALSHI_PRICE_TTL = 0.5  # seconds a get_yes_no_prices() quote is served from cache
 
 KALSHI_SERIES = {
     "nba":     "KXNBAGAME",
@@ -26,6 +30,7 @@ KALSHI_SERIES = {
 
 # ── ESPN API ──────────────────────────────────────────────────────────────────
 ESPN_HEADERS = {"User-Agent": "Mozilla/5.0"}
+ESPN_LIVE_TTL = 5.0    # seconds a get_live_state() response is served from cache
 
 ESPN_SCOREBOARD_ENDPOINTS = {
     "nba":     "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
@@ -44,20 +49,23 @@ ESPN_SUMMARY_ENDPOINTS = {
 # Only non-obvious mappings needed — identical codes pass through unchanged.
 KALSHI_TO_ESPN = {
     "nba": {
-        "SAS": "SA",
+        "BRK": "BKN",
+        "GS":  "GSW",
         "NOP": "NO",
         "NYK": "NY",
         "SAS": "SA",
         "UTA": "UTAH",
-        "WAS": "WSH"  
+        "WAS": "WSH",
     },
     "ncaa": {
         'AC': 'ACU',  # Abilene Christian
         'ALBY': 'UALB',  # Albany
+        'BOIS': 'BSU',  # Boise State
         'CAMP': 'CAM',  # Campbell
         'CCAR': 'CCU',  # Coastal Carolina
         'CHAT': 'UTC', # Chattanooga
         'CHS': 'CHST', # Charleston Southern
+        'CLT': 'CHAR', # Charlotte
         'CLMB': 'COLU', # Columbia
         'COOK': 'BCU',  # Bethune-Cookman
         'CSN': 'CSUN', # Cal State Northridge
@@ -105,3 +113,19 @@ KALSHI_TO_ESPN = {
     }
 }
 
+# League → KALSHI_TO_ESPN sub-map. All college leagues share the "ncaa" map.
+TEAM_MAP_LEAGUE = {
+    "nba":     "nba",
+    "ncaa":    "ncaa",
+    "ncaabbm": "ncaa",
+    "ncaabbw": "ncaa",
+}
+
+# Freeze the team maps: intern every code so all lookups share one string
+# object per code, and expose read-only views since nothing mutates them.
+KALSHI_TO_ESPN = MappingProxyType({
+    league: MappingProxyType({
+        sys.intern(kalshi): sys.intern(espn) for kalshi, espn in codes.items()
+    })
+    for league, codes in KALSHI_TO_ESPN.items()
+})
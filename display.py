@@ -3,15 +3,22 @@
 #
 # print_and_trade() is the main entry point: given a merged game row,
 # it fetches live data, evaluates entries, prints a summary, and fires
-# maybe_trade() for each team.
+# maybe_trade() for each team. score_slate() pre-scores a whole league's
+# in-progress games up front for it; flush_orders() submits the trades
+# it queued (orders=) concurrently once the league has been printed.
+
+import logging
 
 from config import USE_MAKER
 from entry import entry_quality
 from espn import get_live_state
 from fees import kalshi_fee
 from kelly import full_kelly
-from kalshi_client import get_yes_no_prices, maybe_trade
-from teams import get_yes_team_from_ticker, normalize_kalshi_code
+from kalshi_client import get_yes_no_prices, maybe_trade, submit_orders, trade_allowed
+from teams import normalize_kalshi_code, yes_team_espn
+
+
+log = logging.getLogger(__name__)
 
 
 # ── Formatters ────────────────────────────────────────────────────────────────
@@ -64,36 +71,110 @@ _NO_DATA_ENTRY = {
 }
 
 
+def _side_quotes(prices: dict, yes_is_home: bool) -> tuple[tuple, tuple]:
+    """Map YES/NO quotes to ((home_bid, home_ask, home_side), (away_...))."""
+    yes = (prices.get("yes_bid", "?"), prices.get("yes_ask", "?"), "yes")
+    no  = (prices.get("no_bid",  "?"), prices.get("no_ask",  "?"), "no")
+    return (yes, no) if yes_is_home else (no, yes)
+
+
+def _entry_args(espn: dict, home_ask, away_ask) -> tuple[tuple | None, tuple | None]:
+    """
+    entry_quality() positional args (p, ask, secs, diff, period) for the home
+    and away sides of an in-progress game, or None where data is missing.
+    """
+    secs   = espn.get("seconds_remaining")
+    period = espn.get("period", 0)
+    try:
+        home_diff = int(espn.get("home_score", "?")) - int(espn.get("away_score", "?"))
+    except (TypeError, ValueError):
+        home_diff = 0
+
+    def args(wp, ask, diff):
+        if wp is None or secs is None or not isinstance(ask, (int, float)):
+            return None
+        return (wp / 100, ask, secs or 0, diff, period)
+
+    return (args(espn.get("home_wp"), home_ask, home_diff),
+            args(espn.get("away_wp"), away_ask, -home_diff))
+
+
+def _yes_is_home(row, league: str) -> bool:
+    return yes_team_espn(row["ticker"], league) == normalize_kalshi_code(row["home_team"], league)
+
+
+def score_slate(
+    rows,
+    league:      str,
+    live_states: dict,
+    live_prices: dict,
+) -> dict:
+    """
+    Entry-score both sides of every in-progress game up front.
+
+    Uses the memoized scalar entry_quality(): a league slate is a few dozen
+    sides, far too few for entry_quality_batch() to repay its numpy/scipy
+    import in a cron-driven run.
+
+    Returns {game_id: (home_entry, away_entry)} for print_and_trade(entries=);
+    games that aren't in progress are omitted.
+    """
+    slate = {}
+    for row in rows:
+        espn = live_states.get(row["game_id"])
+        if not espn or espn.get("game_state") != "in":
+            continue
+        prices = live_prices.get(row["ticker"])
+        if prices is None:
+            slate[row["game_id"]] = (_NO_DATA_ENTRY, _NO_DATA_ENTRY)
+            continue
+        (_, home_ask, _), (_, away_ask, _) = _side_quotes(prices, _yes_is_home(row, league))
+        slate[row["game_id"]] = tuple(
+            entry_quality(*a) if a is not None else _NO_DATA_ENTRY
+            for a in _entry_args(espn, home_ask, away_ask)
+        )
+    return slate
+
+
 def print_and_trade(
-    row,           # a pandas Series / dict row from the merged game DataFrame
+    row,           # a dict / pandas Series row from the merged game DataFrame
     client,
     league:  str,
     dry_run: bool = True,
+    espn:    dict | None = None,
+    prices:  dict | None = None,
+    entries: tuple[dict, dict] | None = None,
+    orders:  list[dict] | None = None,
 ) -> None:
     """
     For one matched game:
-      1. Fetch live ESPN state + Kalshi prices.
-      2. Evaluate entry quality for home and away sides.
+      1. Fetch live ESPN state + Kalshi prices (unless prefetched via
+         espn= / prices=).
+      2. Evaluate entry quality for home and away sides (unless already
+         scored via entries=, see score_slate()).
       3. Print a formatted summary.
-      4. Call maybe_trade() for each side.
+      4. Call maybe_trade() for each side — or, given an orders= list,
+         append the sides that pass its guards for flush_orders().
     """
     game_id   = row["game_id"]
     ticker    = row["ticker"]
     home_code = normalize_kalshi_code(row["home_team"], league)
     away_code = normalize_kalshi_code(row["away_team"], league)
-    yes_team  = normalize_kalshi_code(get_yes_team_from_ticker(ticker), league)
+    yes_team  = yes_team_espn(ticker, league)
     yes_is_home = yes_team == home_code
 
-    espn   = get_live_state(game_id, league)
-    prices = get_yes_no_prices(ticker, client)
+    if espn is None:
+        espn = get_live_state(game_id, league)
+    if prices is None:
+        prices = get_yes_no_prices(ticker, client)
 
-    # Debug line — confirms mapping is correct
-    print(
-        f"  [DEBUG] raw prices: yes_bid={prices.get('yes_bid')}  "
-        f"yes_ask={prices.get('yes_ask')}  "
-        f"no_bid={prices.get('no_bid')}  "
-        f"no_ask={prices.get('no_ask')}  "
-        f"yes_team={yes_team}  yes_is_home={yes_is_home}"
+    # Debug line — confirms mapping is correct (formatted only if enabled)
+    log.debug(
+        "raw prices: yes_bid=%s  yes_ask=%s  no_bid=%s  no_ask=%s  "
+        "yes_team=%s  yes_is_home=%s",
+        prices.get("yes_bid"), prices.get("yes_ask"),
+        prices.get("no_bid"), prices.get("no_ask"),
+        yes_team, yes_is_home,
     )
 
     if espn.get("game_state") == "final":
@@ -104,19 +185,11 @@ def print_and_trade(
         return
 
     # Map YES/NO sides to home/away
-    if yes_is_home:
-        home_bid, home_ask = prices.get("yes_bid", "?"), prices.get("yes_ask", "?")
-        away_bid, away_ask = prices.get("no_bid",  "?"), prices.get("no_ask",  "?")
-        home_side, away_side = "yes", "no"
-    else:
-        home_bid, home_ask = prices.get("no_bid",  "?"), prices.get("no_ask",  "?")
-        away_bid, away_ask = prices.get("yes_bid", "?"), prices.get("yes_ask", "?")
-        home_side, away_side = "no", "yes"
+    (home_bid, home_ask, home_side), (away_bid, away_ask, away_side) = \
+        _side_quotes(prices, yes_is_home)
 
     home_espn_wp = espn.get("home_wp")
     away_espn_wp = espn.get("away_wp")
-    secs         = espn.get("seconds_remaining")
-    period       = espn.get("period", 0)
 
     home_edge  = _calc_edge(home_espn_wp, home_ask)
     away_edge  = _calc_edge(away_espn_wp, away_ask)
@@ -145,30 +218,11 @@ def print_and_trade(
     clock      = f"{espn['period_str']} {espn['clock']}"
     poss       = espn.get("possession") or "—"
 
-    try:
-        home_diff = int(home_score) - int(away_score)
-        away_diff = -home_diff
-    except (TypeError, ValueError):
-        home_diff = away_diff = 0
-
-    def can_compute(wp, ask):
-        return wp is not None and secs is not None and isinstance(ask, (int, float))
-
-    home_entry = entry_quality(
-        p_current         = home_espn_wp / 100,
-        kalshi_ask        = home_ask,
-        seconds_remaining = secs or 0,
-        score_diff        = home_diff,
-        period            = period,
-    ) if can_compute(home_espn_wp, home_ask) else _NO_DATA_ENTRY
-
-    away_entry = entry_quality(
-        p_current         = away_espn_wp / 100,
-        kalshi_ask        = away_ask,
-        seconds_remaining = secs or 0,
-        score_diff        = away_diff,
-        period            = period,
-    ) if can_compute(away_espn_wp, away_ask) else _NO_DATA_ENTRY
+    if entries is None:
+        home_args, away_args = _entry_args(espn, home_ask, away_ask)
+        entries = (entry_quality(*home_args) if home_args else _NO_DATA_ENTRY,
+                   entry_quality(*away_args) if away_args else _NO_DATA_ENTRY)
+    home_entry, away_entry = entries
 
     print(f"Game {game_id}:")
     print(f"  {home_code}: {home_score} pts  ESPN: {home_espn_wp}%  "
@@ -187,7 +241,15 @@ def print_and_trade(
         (away_code, away_entry, away_side, away_ask),
     ]:
         ask_int = int(ask) if isinstance(ask, (int, float)) else 0
-        result  = maybe_trade(
+        if orders is not None:
+            if trade_allowed(ticker, side, entry, ask_int):
+                orders.append({
+                    "ticker": ticker, "side": side, "ask_price": ask_int,
+                    "contracts": entry["contracts"],
+                    "team_code": team_code, "entry": entry,
+                })
+            continue
+        result = maybe_trade(
             client    = client,
             ticker    = ticker,
             side      = side,
@@ -195,15 +257,33 @@ def print_and_trade(
             ask_price = ask_int,
             dry_run   = dry_run,
         )
-        if result and result["status"] in ("placed", "dry_run"):
-            cost = result["contracts"] * (ask_int / 100)
-            tag  = "[DRY RUN] " if dry_run else ""
-            print(
-                f"  {tag}⚡ TRADE: {team_code}  "
-                f"{side.upper()}  {result['contracts']} contracts @ {ask}¢  "
-                f"cost ~${cost:.2f}  survival={entry['survival']:.0%}  "
-                f"score={entry['score']}"
-            )
+        _print_trade(team_code, side, ask_int, entry, result, dry_run)
 
     print("-" * 60)
     print()
+
+
+def _print_trade(team_code: str, side: str, ask: int, entry: dict,
+                 result: dict | None, dry_run: bool) -> None:
+    if result and result["status"] in ("placed", "dry_run"):
+        cost = result["contracts"] * (ask / 100)
+        tag  = "[DRY RUN] " if dry_run else ""
+        print(
+            f"  {tag}⚡ TRADE: {team_code}  "
+            f"{side.upper()}  {result['contracts']} contracts @ {ask}¢  "
+            f"cost ~${cost:.2f}  survival={entry['survival']:.0%}  "
+            f"score={entry['score']}"
+        )
+
+
+def flush_orders(client, orders: list[dict], dry_run: bool = True) -> None:
+    """
+    Submit the trades print_and_trade(orders=) queued, concurrently (see
+    kalshi_client.submit_orders()), and print a TRADE line for each fill.
+    """
+    if not orders:
+        return
+    for o, result in zip(orders, submit_orders(client, orders, dry_run)):
+        _print_trade(o["team_code"], o["side"], o["ask_price"], o["entry"],
+                     result, dry_run)
+    print()
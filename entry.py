@@ -3,10 +3,16 @@
 #
 # Public entry points:
 #   entry_quality()  — full evaluation, returns sizing + recommendation
+#   entry_quality_batch() — same evaluation over arrays of inputs
+#   clear_entry_cache() — drop entry_quality()'s memoized results
 #   is_effectively_locked() — score-differential gate for early periods
 
 import math
-from scipy.stats import norm
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 from config import (
     BANKROLL, USE_MAKER, MAX_TRADE,
@@ -16,6 +22,14 @@ from fees import kalshi_fee
 from kelly import max_kelly_for_drawdown_constraint
 
 
+_INV_SQRT2        = 1.0 / math.sqrt(2)
+_INV_GAME_SECONDS = 1.0 / 2880   # regulation length; τ = seconds · this
+
+# entry_quality() cache key granularity. ESPN WP arrives in whole percent and
+# Kalshi asks in whole cents, so only the game clock needs bucketing.
+_SECONDS_BUCKET = 5
+
+
 # ── Early-game gate ───────────────────────────────────────────────────────────
 
 def is_effectively_locked(score_diff: int, seconds_remaining: int) -> bool:
@@ -50,25 +64,65 @@ def wp_survival_probability(
     if seconds_remaining <= 0:
         return 1.0 if p_current >= p_floor else 0.0
 
-    tau    = seconds_remaining / 2880
+    tau    = seconds_remaining * _INV_GAME_SECONDS
     wp_vol = 0.28 * math.sqrt(tau) * math.sqrt(
         max(0.0, p_current * (1 - p_current) * 4))
 
     if wp_vol < 1e-6:
         return 1.0 if p_current >= p_floor else 0.0
 
-    z        = (p_current - p_floor) / wp_vol
-    survival = norm.cdf(z) - math.exp(-2 * z**2) * norm.cdf(-z)
-    return max(0.0, min(1.0, survival))
+    return _reflected_survival((p_current - p_floor) / wp_vol)
 
 
 def wp_volatility_remaining(p_current: float, seconds_remaining: int) -> float:
     """Expected WP volatility for the remaining game time."""
-    tau  = seconds_remaining / 2880
+    tau  = seconds_remaining * _INV_GAME_SECONDS
     base = p_current * (1 - p_current)
     return round(math.sqrt(max(0.0, base * tau)) * 0.85, 4)
 
 
+def _reflected_survival(z: float) -> float:
+    """Survival of reflected Brownian motion started z std-devs above the floor."""
+    # Beyond ±6σ the answer is within 1e-9 of 0 or 1 — skip the libm calls
+    if z > 6.0:
+        return 1.0
+    if z < -6.0:
+        return 0.0
+
+    # Φ(x) = ½(1 + erf(x/√2)) — scalar libm, no scipy dispatch per call
+    cdf_pos = 0.5 * (1.0 + math.erf(z * _INV_SQRT2))
+    z2      = z * z
+    if z2 > 20.0:
+        # exp(-2z²) < 5e-18: the reflection term vanishes
+        return max(0.0, min(1.0, cdf_pos))
+
+    cdf_neg  = 0.5 * (1.0 + math.erf(-z * _INV_SQRT2))
+    survival = cdf_pos - math.exp(-2 * z2) * cdf_neg
+    return max(0.0, min(1.0, survival))
+
+
+def _wp_stats(
+    p_current:         float,
+    p_floor:           float,
+    seconds_remaining: int,
+) -> tuple[float, float]:
+    """
+    (survival, vol_remaining) in one pass for entry_quality().
+
+    Both helpers above scale √(p(1-p)·τ): the survival σ is
+    0.28·√τ·√(4p(1-p)) = 0.56·√(p(1-p)·τ), so one sqrt serves both.
+    """
+    tau  = seconds_remaining * _INV_GAME_SECONDS
+    root = math.sqrt(max(0.0, p_current * (1 - p_current) * tau))
+
+    vol_remaining = round(root * 0.85, 4)
+    wp_vol        = 0.56 * root
+
+    if seconds_remaining <= 0 or wp_vol < 1e-6:
+        return (1.0 if p_current >= p_floor else 0.0), vol_remaining
+    return _reflected_survival((p_current - p_floor) / wp_vol), vol_remaining
+
+
 # ── Zero-sizing helper ────────────────────────────────────────────────────────
 
 def _zero_sizing(
@@ -121,23 +175,71 @@ def entry_quality(
 
     'contracts' is always 0 when recommendation contains SKIP or WAIT.
     'maybe_trade' treats any SKIP/WAIT recommendation as a hard block.
+
+    Results are memoized on discretized inputs: seconds_remaining is rounded
+    up to the next _SECONDS_BUCKET, so the cached evaluation never assumes
+    less time left than there really is.
     """
+    seconds_key = -(-seconds_remaining // _SECONDS_BUCKET) * _SECONDS_BUCKET
+    return dict(_entry_quality_cached(
+        round(p_current, 3), kalshi_ask, seconds_key, score_diff, period,
+        bankroll, maker, min_edge, min_survival,
+    ))
+
+
+def _entry_quality_impl(
+    p_current:         float,
+    kalshi_ask:        float | int,
+    seconds_remaining: int,
+    score_diff:        int,
+    period:            int,
+    bankroll:          float,
+    maker:             bool,
+    min_edge:          float,
+    min_survival:      float,
+) -> dict:
+    """Uncached body of entry_quality(); see there for the return schema."""
     price    = kalshi_ask / 100 if kalshi_ask > 1 else float(kalshi_ask)
     fee      = kalshi_fee(1, kalshi_ask, maker=maker)
     net_win  = (1 - price) - fee
     raw_edge = p_current - price
 
-    vol_remaining = wp_volatility_remaining(p_current, seconds_remaining)
-    vel_norm      = min(1.0, 3600 / max(seconds_remaining, 60))
-    survival      = wp_survival_probability(
-        p_current         = p_current,
-        p_floor           = price + 0.02,
-        seconds_remaining = seconds_remaining,
-        score_diff        = score_diff,
+    vel_norm                = min(1.0, 3600 / max(seconds_remaining, 60))
+    survival, vol_remaining = _wp_stats(
+        p_current, price + 0.02, seconds_remaining)
+
+    return _score_entry(
+        p_current, price, net_win, raw_edge,
+        survival, vol_remaining, vel_norm,
+        seconds_remaining, score_diff, period,
+        bankroll, min_edge, min_survival,
     )
 
+
+def _score_entry(
+    p_current:         float,
+    price:             float,
+    net_win:           float,
+    raw_edge:          float,
+    survival:          float,
+    vol_remaining:     float,
+    vel_norm:          float,
+    seconds_remaining: int,
+    score_diff:        int,
+    period:            int,
+    bankroll:          float,
+    min_edge:          float,
+    min_survival:      float,
+    _min_price:        int   = MIN_PRICE,
+    _max_trade:        float = MAX_TRADE,
+) -> dict:
+    """
+    Gates, Kelly sizing, composite score and recommendation, given the
+    per-side numeric inputs computed by entry_quality() / entry_quality_batch().
+    Underscore defaults bind config constants as fast locals.
+    """
     # ── Hard block 1: below target price zone ─────────────────────────
-    if price < (MIN_PRICE / 100):
+    if price < (_min_price / 100):
         return _zero_sizing("SKIP — below target zone",
                             raw_edge, survival, vol_remaining, vel_norm)
 
@@ -190,7 +292,7 @@ def entry_quality(
     dollars = contracts = ev = 0
     if kelly_c["valid"] and kelly_c["f_max"] > 0:
         raw_dollars = bankroll * kelly_c["f_max"]
-        dollars     = round(min(raw_dollars, MAX_TRADE), 2)
+        dollars     = round(min(raw_dollars, _max_trade), 2)
         contracts   = max(0, int(dollars / price))
         ev          = round(
             ((p_current * net_win) - ((1 - p_current) * price)) * contracts, 2)
@@ -222,3 +324,81 @@ def entry_quality(
         "contracts":        contracts,
         "ev":               ev,
     }
+
+
+_entry_quality_cached = lru_cache(maxsize=4096)(_entry_quality_impl)
+
+
+def clear_entry_cache() -> None:
+    """Drop every memoized entry_quality() result (e.g. after config changes)."""
+    _entry_quality_cached.cache_clear()
+
+
+# ── Batch scorer ──────────────────────────────────────────────────────────────
+
+def entry_quality_batch(
+    p_current:         "np.ndarray",
+    kalshi_ask:        "np.ndarray",
+    seconds_remaining: "np.ndarray",
+    score_diff:        "np.ndarray",
+    period:            "np.ndarray",
+    bankroll:          float = BANKROLL,
+    maker:             bool  = USE_MAKER,
+    min_edge:          float = MIN_EDGE,
+    min_survival:      float = MIN_SURVIVAL,
+) -> list[dict]:
+    """
+    Evaluate many entries at once (e.g. both sides of every game on a slate).
+
+    Fees, edge, volatility, velocity and survival are computed as whole-array
+    NumPy expressions; only the gates and the Kelly solve run per element.
+    Returns one entry_quality()-shaped dict per input, in input order.
+
+    Inputs are discretized exactly as entry_quality() does (p to 3 places,
+    seconds up to the next _SECONDS_BUCKET), so a game scores the same
+    whether it's evaluated alone or as part of a slate.
+    """
+    # Deferred: NumPy/SciPy cost ~0.3s to import and only this path needs them
+    import numpy as np
+    from scipy.special import ndtr
+
+    # Python's round(), not np.round: they disagree on ties like 0.9925
+    p     = np.array([round(x, 3) for x in np.asarray(p_current, dtype=float).tolist()])
+    ask   = np.asarray(kalshi_ask,        dtype=float)
+    secs  = np.ceil(np.asarray(seconds_remaining, dtype=float) / _SECONDS_BUCKET) * _SECONDS_BUCKET
+    diffs = np.asarray(score_diff,        dtype=int)
+    pers  = np.asarray(period,            dtype=int)
+
+    price    = np.where(ask > 1, ask / 100, ask)
+    fee      = np.fromiter((kalshi_fee(1, a, maker=maker) for a in ask.tolist()),
+                           dtype=float, count=ask.size)
+    net_win  = (1 - price) - fee
+    raw_edge = p - price
+
+    pq       = p * (1 - p)
+    vel_norm = np.minimum(1.0, 3600 / np.maximum(secs, 60))
+    p_floor  = price + 0.02
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root     = np.sqrt(np.maximum(0.0, pq * (secs * _INV_GAME_SECONDS)))
+        vol_raw  = root * 0.85
+        wp_vol   = 0.56 * root
+        z        = (p - p_floor) / wp_vol
+        survival = ndtr(z) - np.exp(-2 * z**2) * ndtr(-z)
+
+    decided  = (secs <= 0) | ~(wp_vol >= 1e-6)
+    survival = np.where(decided, (p >= p_floor).astype(float),
+                        np.clip(survival, 0.0, 1.0))
+
+    return [
+        _score_entry(
+            p_i, price_i, net_win_i, edge_i, surv_i, round(vol_i, 4), vel_i,
+            int(secs_i), diff_i, per_i,
+            bankroll, min_edge, min_survival,
+        )
+        for p_i, price_i, net_win_i, edge_i, surv_i, vol_i, vel_i,
+            secs_i, diff_i, per_i
+        in zip(p.tolist(), price.tolist(), net_win.tolist(), raw_edge.tolist(),
+               survival.tolist(), vol_raw.tolist(), vel_norm.tolist(),
+               secs.tolist(), diffs.tolist(), pers.tolist())
+    ]
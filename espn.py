@@ -1,14 +1,46 @@
 # espn.py
 # ESPN API interactions.
 #
-# Two responsibilities:
-#   fetch_scoreboard()  — pull today's game list for a league (used by get_espn_games.py)
-#   get_live_state()    — pull current score, WP, clock for a specific game_id
+# Responsibilities:
+#   fetch_scoreboard()      — pull today's game list for a league (used by get_espn_games.py)
+#   get_live_state()        — pull current score, WP, clock for a specific game_id
+#   get_live_states_bulk()  — get_live_state() for many games concurrently
 
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import ESPN_HEADERS, ESPN_SCOREBOARD_ENDPOINTS, ESPN_SUMMARY_ENDPOINTS
+try:
+    import ijson
+except ImportError:  # optional: fall back to parsing the whole document
+    ijson = None
+
+import jsonio
+from teams import match_key
+from config import (
+    ESPN_HEADERS, ESPN_LIVE_TTL,
+    ESPN_SCOREBOARD_ENDPOINTS, ESPN_SUMMARY_ENDPOINTS,
+)
+
+
+# ── HTTP plumbing ─────────────────────────────────────────────────────────────
+
+# All ESPN endpoints share one host; a pooled session keeps those TCP+TLS
+# connections alive across calls instead of handshaking per request.
+# Transient gateway errors get two quick retries before surfacing.
+_MAX_WORKERS = 16
+_RETRY       = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+
+_SESSION = requests.Session()
+_SESSION.headers.update(ESPN_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=_MAX_WORKERS, max_retries=_RETRY))
+
+_POOL = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
 
 
 # ── Scoreboard (game discovery) ───────────────────────────────────────────────
@@ -19,22 +51,18 @@ def fetch_scoreboard(league: str, date: str = None) -> list[dict]:
     If date is None, uses today's date. Date format: YYYYMMDD.
 
     Returns a list of dicts:
-        game_id, home_team, away_team, status, date, time
+        game_id, home_team, away_team, status, date, time, match_key
     """
     url = ESPN_SCOREBOARD_ENDPOINTS.get(league)
     if not url:
         raise ValueError(f"Unknown league: {league!r}")
 
-    params = {}
-    if date:
-        params["dates"] = date
-
-    scoreboard = requests.get(url, headers=ESPN_HEADERS, params=params or None, timeout=10).json()
+    date = date or datetime.today().strftime("%Y%m%d")
     # ESPN returns ISO 8601 date in event["date"], but we want to record the date we fetched for
     fetch_date = datetime.today().strftime("%Y-%m-%d")
     games = []
 
-    for event in scoreboard.get("events", []):
+    for event in _iter_events(url, date):
         abbrev    = event.get("shortName", "?")
         teams     = abbrev.split(" @ ") if " @ " in abbrev else ["?", "?"]
         home_team = teams[1] if len(teams) == 2 else "?"
@@ -47,30 +75,66 @@ def fetch_scoreboard(league: str, date: str = None) -> list[dict]:
             "status":    event.get("status", {}).get("type", {}).get("name", "?"),
             "date":      fetch_date,
             "time":      event.get("date"),  # ISO 8601
+            "match_key": match_key(fetch_date, home_team, away_team),
         })
 
     return games
 
 
+def _iter_events(url: str, date: str):
+    """
+    Yield scoreboard events one at a time.
+
+    With ijson installed the body is stream-parsed, so only one event dict
+    is alive at once instead of the whole tree (odds, broadcasts, venues...)
+    we mostly ignore.
+    """
+    if ijson is None:
+        resp = _SESSION.get(url, params={"dates": date}, timeout=10)
+        yield from jsonio.loads(resp.content).get("events", [])
+        return
+
+    resp = _SESSION.get(url, params={"dates": date}, timeout=10, stream=True)
+    try:
+        resp.raw.decode_content = True   # let urllib3 undo gzip before ijson reads
+        yield from ijson.items(resp.raw, "events.item")
+    finally:
+        resp.close()
+
+
 # ── Live game state ───────────────────────────────────────────────────────────
 
+# period → display label; periods past the table fall back to an f-string
+_PERIOD_STR = ("PRE", "Q1", "Q2", "Q3", "Q4", "OT1", "OT2", "OT3", "OT4", "OT5", "OT6")
+
+
 def _parse_seconds_remaining(clock: str, period: int) -> int | None:
     """
     Convert a display clock string + period into total seconds left in the game.
     Handles both 'MM:SS' and decimal (seconds-only) formats.
     """
+    minutes, sep, seconds = clock.partition(":")
     try:
-        if ":" in clock:
-            parts             = clock.split(":")
-            clock_seconds     = int(parts[0]) * 60 + int(float(parts[1]))
+        if sep:
+            # 'MM:SS' or 'MM:SS.t' — whole seconds only, no float round-trip
+            clock_seconds = int(minutes) * 60 + int(seconds.partition(".")[0])
         else:
             clock_seconds = int(float(clock))
-
-        quarters_left = max(0, 4 - period)
-        return clock_seconds + quarters_left * 12 * 60
-    except (ValueError, IndexError):
+    except ValueError:
         return None
 
+    quarters_left = max(0, 4 - period)
+    return clock_seconds + quarters_left * 12 * 60
+
+
+# (game_id, league) → (monotonic fetch time, state dict).
+# ESPN refreshes summaries every few seconds; polling faster than that only
+# re-downloads the same payload. Writes (from get_live_states_bulk's pool)
+# go through the lock and sweep out expired entries, so a long-running
+# poller only ever holds the games it polled within the last TTL.
+_live_cache: dict[tuple[str, str], tuple[float, dict]] = {}
+_live_lock  = threading.Lock()
+
 
 def get_live_state(game_id: str, league: str = "nba") -> dict:
     """
@@ -82,34 +146,47 @@ def get_live_state(game_id: str, league: str = "nba") -> dict:
         seconds_remaining, possession
 
     game_state is one of: 'pre', 'in', 'post', 'final', 'error'
+
+    Responses are reused for ESPN_LIVE_TTL seconds; errors are never cached.
     """
+    key = (game_id, league)
+    now = time.monotonic()
+    hit = _live_cache.get(key)
+    if hit and now - hit[0] < ESPN_LIVE_TTL:
+        return dict(hit[1])
+
+    state = _fetch_live_state(game_id, league)
+    if state.get("game_state") != "error":
+        with _live_lock:
+            expired = [k for k, (t, _) in _live_cache.items() if now - t >= ESPN_LIVE_TTL]
+            for k in expired:
+                del _live_cache[k]
+            _live_cache[key] = (now, state)
+    return dict(state)
+
+
+def _fetch_live_state(game_id: str, league: str) -> dict:
+    """Uncached ESPN summary fetch + parse; see get_live_state()."""
     endpoint = ESPN_SUMMARY_ENDPOINTS.get(league, ESPN_SUMMARY_ENDPOINTS["nba"])
 
     try:
-        data  = requests.get(
-            endpoint, params={"event": game_id},
-            headers=ESPN_HEADERS, timeout=5,
-        ).json()
+        data  = jsonio.loads(_SESSION.get(
+            endpoint, params={"event": game_id}, timeout=5,
+        ).content)
     except Exception as e:
         return {"game_id": game_id, "game_state": "error", "error": str(e)}
 
     try:
-        comp      = data.get("header", {}).get("competitions", [{}])[0]
-        status    = comp.get("status", {})
-        stype     = status.get("type", {})
-        state     = stype.get("state", "pre")
-        completed = stype.get("completed", False)
-        period    = status.get("period", 0)
-        clock     = status.get("displayClock", "?")
-        detail    = stype.get("shortDetail", "")
-
-        period_str = (
-            f"Q{period}"       if 1 <= period <= 4 else
-            f"OT{period - 4}"  if period > 4        else
-            "PRE"
-        )
-
-        if completed or state == "post":
+        # Walk header → competition → status once; `or` guards explicit nulls
+        header       = data.get("header") or {}
+        competitions = header.get("competitions") or ({},)
+        comp         = competitions[0]
+        status       = comp.get("status") or {}
+        stype        = status.get("type") or {}
+        state        = stype.get("state", "pre")
+        detail       = stype.get("shortDetail", "")
+
+        if stype.get("completed", False) or state == "post":
             return {
                 "game_id": game_id, "game_state": "final",
                 "period_str": "FINAL", "clock": "", "detail": detail,
@@ -125,33 +202,42 @@ def get_live_state(game_id: str, league: str = "nba") -> dict:
                 "period": 0,
             }
 
-        # Scores and team IDs
-        home_score = away_score = None
-        home_team_id = away_team_id = None
-        for c in comp.get("competitors", []):
-            if c.get("homeAway") == "home":
-                home_score   = c.get("score", "?")
-                home_team_id = c.get("team", {}).get("id")
-            else:
-                away_score   = c.get("score", "?")
-                away_team_id = c.get("team", {}).get("id")
+        period = status.get("period", 0)
+        clock  = status.get("displayClock", "?")
+        if 0 <= period < len(_PERIOD_STR):
+            period_str = _PERIOD_STR[period]
+        else:
+            period_str = f"OT{period - 4}" if period > 0 else "PRE"
+
+        # Scores and team IDs — ESPN lists exactly two competitors
+        home_c = away_c = {}
+        competitors = comp.get("competitors") or ()
+        if len(competitors) == 2:
+            home_c, away_c = (
+                competitors if competitors[0].get("homeAway") == "home"
+                else competitors[::-1]
+            )
+        home_score   = home_c.get("score", "?") if home_c else None
+        away_score   = away_c.get("score", "?") if away_c else None
+        home_team_id = (home_c.get("team") or {}).get("id")
+        away_team_id = (away_c.get("team") or {}).get("id")
 
         # Win probability
         home_wp = away_wp = None
-        wp_series = data.get("winprobability", [])
+        wp_series = data.get("winprobability")
         if wp_series:
-            last    = wp_series[-1]
-            home_wp = round(last["homeWinPercentage"] * 100)
+            home_wp = round(wp_series[-1]["homeWinPercentage"] * 100)
             away_wp = 100 - home_wp
 
         # Possession
         possession   = None
-        situation    = data.get("situation", comp.get("situation", {}))
+        situation    = data.get("situation") or comp.get("situation") or {}
         poss_team_id = situation.get("possession")
         if poss_team_id:
-            if str(poss_team_id) == str(home_team_id):
+            poss_team_id = str(poss_team_id)
+            if poss_team_id == str(home_team_id):
                 possession = "home"
-            elif str(poss_team_id) == str(away_team_id):
+            elif poss_team_id == str(away_team_id):
                 possession = "away"
 
         return {
@@ -171,3 +257,12 @@ def get_live_state(game_id: str, league: str = "nba") -> dict:
 
     except Exception as e:
         return {"game_id": game_id, "game_state": "error", "error": str(e)}
+
+
+def get_live_states_bulk(game_ids: list[str], league: str = "nba") -> dict[str, dict]:
+    """
+    Fetch get_live_state() for many games concurrently.
+    Returns {game_id: state} with the same per-game schema.
+    """
+    states = _POOL.map(lambda gid: get_live_state(gid, league), game_ids)
+    return dict(zip(game_ids, states))
@@ -8,14 +8,28 @@
 #
 # P is expressed as a decimal (0–1), C is contract count.
 
-from decimal import Decimal, ROUND_CEILING
+import math
 
 
-_TAKER_RATE = Decimal("0.07")
-_MAKER_RATE = Decimal("0.0175")
+_TAKER_RATE = 0.07
+_MAKER_RATE = 0.0175
 
+# Float products land a few ULPs above exact cent values (e.g. 1.7500000000000002),
+# which a bare ceil would bump up a whole cent. Exact fees on whole-cent prices
+# are multiples of 2.5e-5 cents, so this never swallows a genuine fraction.
+_CENT_EPS = 1e-9
 
-def kalshi_fee(contracts: int, price: float | int, maker: bool = False) -> float:
+
+def kalshi_fee(
+    contracts: int,
+    price:     float | int,
+    maker:     bool = False,
+    *,
+    _taker:    float = _TAKER_RATE,
+    _maker:    float = _MAKER_RATE,
+    _eps:      float = _CENT_EPS,
+    _ceil=math.ceil,
+) -> float:
     """
     Return total fee in dollars for a batch of contracts.
 
@@ -24,11 +38,13 @@ def kalshi_fee(contracts: int, price: float | int, maker: bool = False) -> float
         price:     Price in cents (e.g. 82) OR as a decimal (e.g. 0.82).
         maker:     True for maker (post-only) orders, False for taker.
 
+    Underscore keyword defaults bind module constants as fast locals;
+    callers should not pass them.
+
     Returns:
         Fee in dollars, rounded up to the nearest cent.
     """
-    rate = _MAKER_RATE if maker else _TAKER_RATE
-    c    = Decimal(str(contracts))
-    p    = Decimal(str(price / 100 if price > 1 else price))
-    raw  = rate * c * p * (1 - p)
-    return float(raw.quantize(Decimal("0.01"), rounding=ROUND_CEILING))
+    rate = _maker if maker else _taker
+    p    = price / 100 if price > 1 else price
+    raw  = rate * contracts * p * (1 - p)
+    return _ceil(raw * 100 - _eps) / 100
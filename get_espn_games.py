@@ -3,26 +3,38 @@
 # Fetches today's games from ESPN and writes espn_games_{league}.json.
 # Run this once before the main trading loop.
 
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from espn import fetch_scoreboard
+from jsonio import dump_file
 from config import ESPN_SUMMARY_ENDPOINTS   # just to validate league names
 
 LEAGUES = list(ESPN_SUMMARY_ENDPOINTS.keys())  # ["nba", "ncaabbm", "ncaabbw"]
 
 
+def fetch_and_write(league: str, date: str) -> tuple[str, int]:
+    """Fetch one league's scoreboard and write it; returns (filename, count)."""
+    games    = fetch_scoreboard(league, date=date)
+    filename = f"espn_games_{league}.json"
+    dump_file(games, filename)
+    return filename, len(games)
+
+
 def main():
     from datetime import datetime
     # Always use today's date in YYYYMMDD for ESPN fetch
     today_str = datetime.today().strftime("%Y%m%d")
-    for league in LEAGUES:
+
+    # Leagues are independent requests — fetch them all at once, then report
+    # in league order
+    with ThreadPoolExecutor(max_workers=len(LEAGUES)) as pool:
+        futures = {lg: pool.submit(fetch_and_write, lg, today_str) for lg in LEAGUES}
+
+    for league, future in futures.items():
         try:
-            games    = fetch_scoreboard(league, date=today_str)
-            filename = f"espn_games_{league}.json"
-            with open(filename, "w") as f:
-                json.dump(games, f, indent=4)
-            print(f"Wrote {len(games)} games to {filename}")
+            filename, count = future.result()
+            print(f"Wrote {count} games to {filename}")
         except Exception as e:
             print(f"Error fetching {league}: {e}", file=sys.stderr)
 
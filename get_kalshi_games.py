@@ -3,24 +3,36 @@
 # Fetches today's open Kalshi markets and writes kalshi_games_{league}.json.
 # Run this once before the main trading loop.
 
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from kalshi_client import get_kalshi_client, get_league_games
+from jsonio import dump_file
 from config import KALSHI_SERIES
 
 LEAGUES = list(KALSHI_SERIES.keys())  # ["nba", "ncaabbm", "ncaabbw"]
 
 
+def fetch_and_write(client, league: str) -> tuple[str, int]:
+    """Fetch one league's markets and write them; returns (filename, count)."""
+    games    = get_league_games(client, league)
+    filename = f"kalshi_games_{league}.json"
+    dump_file(games, filename)
+    return filename, len(games)
+
+
 def main():
     client = get_kalshi_client()
-    for league in LEAGUES:
+
+    # Leagues are independent requests — fetch them all at once, then report
+    # in league order
+    with ThreadPoolExecutor(max_workers=len(LEAGUES)) as pool:
+        futures = {lg: pool.submit(fetch_and_write, client, lg) for lg in LEAGUES}
+
+    for league, future in futures.items():
         try:
-            games    = get_league_games(client, league)
-            filename = f"kalshi_games_{league}.json"
-            with open(filename, "w") as f:
-                json.dump(games, f, indent=4)
-            print(f"Wrote {len(games)} games to {filename}")
+            filename, count = future.result()
+            print(f"Wrote {count} games to {filename}")
         except Exception as e:
             print(f"Error fetching {league}: {e}", file=sys.stderr)
 
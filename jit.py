@@ -0,0 +1,25 @@
+# jit.py
+# Opt-in Numba JIT for the pure-float Kelly kernels (kelly.py).
+#
+# Off by default: importing numba and loading even disk-cached kernels costs
+# ~0.6 s per process, far more than compiled code saves in a cron-driven run.
+# Set STUART_JIT=1 for long-running pollers; numba is imported only then, and
+# without it installed @njit stays a no-op. Results are identical either way.
+
+import os
+
+JIT_ENABLED = os.environ.get("STUART_JIT") == "1"
+
+
+def njit(*args, **kwargs):
+    """numba.njit when STUART_JIT=1 and numba is installed, else identity.
+    Supports both @njit and @njit(...)."""
+    bare = len(args) == 1 and callable(args[0]) and not kwargs
+    if JIT_ENABLED:
+        try:
+            from numba import njit as numba_njit
+        except ImportError:
+            pass
+        else:
+            return numba_njit(*args, **kwargs)
+    return args[0] if bare else (lambda fn: fn)
@@ -0,0 +1,38 @@
+# jsonio.py
+# JSON encode/decode shared by every read/write path.
+#
+# Uses orjson when it's installed (C parser, bytes-native, several times
+# faster than stdlib on scoreboard-sized payloads) and falls back to the
+# stdlib json module otherwise. Both paths speak bytes.
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+else:
+    loads = json.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def load_file(path: str):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(obj, path: str, indent: bool = True) -> None:
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent))
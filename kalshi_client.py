@@ -4,66 +4,193 @@
 # Order state is tracked in module-level _orders_placed to prevent re-entering
 # the same (ticker, side) within a single polling session.
 
+import logging
+import re
+import threading
+import time
 import kalshi_python
+from concurrent.futures import ThreadPoolExecutor
 
 from config import (
-    KALSHI_HOST, KALSHI_KEY_ID, KALSHI_PEM,
+    KALSHI_HOST, KALSHI_KEY_ID, KALSHI_PEM, KALSHI_PRICE_TTL,
     KALSHI_SERIES, MIN_PRICE, MIN_EDGE, MIN_SURVIVAL,
 )
 from datetime import datetime
+from teams import get_normalization_map, match_key
+
+
+log   = logging.getLogger(__name__)
+_POOL = ThreadPoolExecutor(max_workers=16)
 
 
 # ── Session state ─────────────────────────────────────────────────────────────
 
 # Persists for the lifetime of the process; reset between sessions by restarting.
-_orders_placed: set[tuple[str, str]] = set()
+# ticker → side bit flags (yes=1, no=2); one int per market, no tuple per check.
+_SIDE_BIT = {"yes": 1, "no": 2}
+_orders_placed: dict[str, int] = {}
+_orders_lock   = threading.Lock()   # submit_orders() places from pool threads
+
+
+def _mark_traded(ticker: str, side: str) -> None:
+    with _orders_lock:
+        _orders_placed[ticker] = _orders_placed.get(ticker, 0) | _SIDE_BIT[side]
 
 
 def reset_session() -> None:
     """Clear the in-session order tracker (useful for testing)."""
-    _orders_placed.clear()
+    with _orders_lock:
+        _orders_placed.clear()
 
 
 # ── Client factory ────────────────────────────────────────────────────────────
 
+# Built once per process: reading the PEM and parsing the private key only
+# needs to happen on first use, and the client is safe to share across threads.
+_client: kalshi_python.KalshiClient | None = None
+_client_lock = threading.Lock()
+
+
 def get_kalshi_client() -> kalshi_python.KalshiClient:
-    config = kalshi_python.Configuration(host=KALSHI_HOST)
-    with open(KALSHI_PEM, "r") as f:
-        private_key = f.read()
-    config.api_key_id      = KALSHI_KEY_ID
-    config.private_key_pem = private_key
-    return kalshi_python.KalshiClient(config)
+    global _client
+    with _client_lock:
+        if _client is None:
+            config = kalshi_python.Configuration(host=KALSHI_HOST)
+            with open(KALSHI_PEM, "r") as f:
+                private_key = f.read()
+            config.api_key_id      = KALSHI_KEY_ID
+            config.private_key_pem = private_key
+            _client = kalshi_python.KalshiClient(config)
+        return _client
 
 
 # ── Market data ───────────────────────────────────────────────────────────────
 
+# ticker → (monotonic fetch time, prices). Coalesces repeat reads of the same
+# market within one poll; busted after an order so post-trade reads are fresh.
+# Every write sweeps out expired quotes, so a long-running poller only holds
+# markets quoted within the last TTL.
+_price_cache: dict[str, tuple[float, dict]] = {}
+_price_lock   = threading.Lock()
+
+
+def _cache_prices(quotes: dict[str, dict], now: float) -> None:
+    """Store freshly fetched quotes, evicting any that have expired."""
+    with _price_lock:
+        expired = [t for t, (ts, _) in _price_cache.items() if now - ts >= KALSHI_PRICE_TTL]
+        for t in expired:
+            del _price_cache[t]
+        for ticker, prices in quotes.items():
+            _price_cache[ticker] = (now, prices)
+
+
 def get_yes_no_prices(ticker: str, client) -> dict:
     """
     Return current bid/ask for both YES and NO sides of a market.
 
     Returns dict with keys: yes_bid, yes_ask, no_bid, no_ask
     On failure returns: {"error": str}
+
+    Quotes are reused for KALSHI_PRICE_TTL seconds; errors are never cached.
     """
+    now = time.monotonic()
+    hit = _price_cache.get(ticker)
+    if hit and now - hit[0] < KALSHI_PRICE_TTL:
+        return dict(hit[1])
+
     try:
-        m = client.get_market(ticker=ticker).market
-        return {
-            "yes_bid": m.yes_bid, "yes_ask": m.yes_ask,
-            "no_bid":  m.no_bid,  "no_ask":  m.no_ask,
-        }
+        prices = _quote(client.get_market(ticker=ticker).market)
     except Exception as e:
         return {"error": str(e)}
 
+    _cache_prices({ticker: prices}, now)
+    return dict(prices)
+
+
+def bust_price_cache(ticker: str) -> None:
+    """Drop any cached quote for ticker."""
+    with _price_lock:
+        _price_cache.pop(ticker, None)
+
+
+def _quote(m) -> dict:
+    return {
+        "yes_bid": m.yes_bid, "yes_ask": m.yes_ask,
+        "no_bid":  m.no_bid,  "no_ask":  m.no_ask,
+    }
+
+
+_BATCH = 100   # tickers per get_markets call; keeps the query string sane
+
+
+def refresh_prices(client, tickers: list[str]) -> dict[str, dict]:
+    """
+    Fetch quotes for many tickers with batched get_markets(tickers=...) calls
+    (one per _BATCH tickers, run concurrently) instead of one get_market each.
+
+    Returns {ticker: prices} with the get_yes_no_prices() schema and primes
+    the price cache. Tickers a batch didn't return (or whose batch failed)
+    fall back to a single get_yes_no_prices() call.
+    """
+    def fetch(batch: list[str]) -> list:
+        try:
+            return client.get_markets(tickers=",".join(batch), limit=len(batch)).markets or []
+        except Exception:
+            # Don't fail the whole refresh: these tickers fall back to
+            # per-ticker get_yes_no_prices() below
+            log.warning("get_markets batch of %d tickers failed", len(batch), exc_info=True)
+            return []
+
+    batches = [tickers[i:i + _BATCH] for i in range(0, len(tickers), _BATCH)]
+    now     = time.monotonic()
+    quotes  = {m.ticker: _quote(m) for markets in _POOL.map(fetch, batches) for m in markets}
+    _cache_prices(quotes, now)
+
+    prices = {ticker: dict(quote) for ticker, quote in quotes.items()}
+
+    for ticker in tickers:
+        if ticker not in prices:
+            prices[ticker] = get_yes_no_prices(ticker, client)
+    return prices
+
 
 # ── Market discovery ──────────────────────────────────────────────────────────
 
+# series-DATE+TEAMS-YESTEAM, e.g. 'KXNBAGAME-26FEB25BKNLAC-BKN'
+_TICKER_RE = re.compile(r"^[^-]+-(\d{2}[A-Z]{3}\d{2})([^-]*)-([^-]+)")
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+     "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"), start=1)}
+
+# '26FEB25' → '2026-02-25'; every market in a day shares a handful of segments
+_DATE_CACHE: dict[str, str] = {}
+
+
+def _parse_ticker_date(segment: str) -> str:
+    """Parse a YYMONDD ticker segment to 'YYYY-MM-DD', or '?' if malformed."""
+    date_str = _DATE_CACHE.get(segment)
+    if date_str is None:
+        month = _MONTHS.get(segment[2:5].upper())
+        if len(segment) == 7 and month and segment[:2].isdigit() and segment[5:].isdigit():
+            date_str = f"20{segment[:2]}-{month:02d}-{segment[5:]}"
+        else:
+            date_str = "?"
+        _DATE_CACHE[segment] = date_str
+    return date_str
+
+
 def get_league_games(client, league: str) -> list[dict]:
     """
     Fetch today's open markets from Kalshi for a given league.
 
     Returns a list of dicts:
-        ticker, date, home_team, away_team
+        ticker, date, home_team, away_team, match_key
+
+    Team codes stay in Kalshi form; match_key is built from their ESPN
+    equivalents so merge_games can join on it directly.
 
-    Deduplicates by (date, frozenset(teams)) — one row per matchup.
+    Deduplicates by unordered team pair — one row per matchup.
     """
     series_ticker = KALSHI_SERIES.get(league)
     if not series_ticker:
@@ -72,35 +199,34 @@ def get_league_games(client, league: str) -> list[dict]:
     api_response = client.get_markets(
         series_ticker=series_ticker, status="open", limit=1000)
 
-    today_str    = datetime.today().strftime("%Y-%m-%d")
-    deduped: dict = {}
+    today_str = datetime.today().strftime("%Y-%m-%d")
 
-    for market in api_response.markets:
-        ticker = market.ticker
-        parts  = ticker.split("-")
-
-        # Parse date from ticker segment e.g. '26FEB25BKNLAC'
-        date_segment = parts[1] if len(parts) > 1 else ""
-        date_str     = "?"
-        try:
-            date_str = datetime.strptime(date_segment[:7], "%y%b%d").strftime("%Y-%m-%d")
-        except Exception:
-            pass
+    # One compiled match per ticker pulls out the date, both-teams and YES-team
+    # segments of e.g. 'KXNBAGAME-26FEB25BKNLAC-BKN'; only today's rows go on.
+    # Tickers that don't fit the pattern have no usable teams and are dropped.
+    tickers = [m.ticker for m in api_response.markets]
+    matches = [_TICKER_RE.match(t) for t in tickers]
 
-        if date_str != today_str:
+    # Every surviving row shares today's date, so teams alone key the dedup
+    norm = get_normalization_map(league)
+    deduped: dict = {}
+    for ticker, match in zip(tickers, matches):
+        if match is None:
             continue
+        date_segment, both_teams, home_team = match.groups()
+        if _parse_ticker_date(date_segment) != today_str:
+            continue
+        away_team = both_teams.replace(home_team, "")
 
-        home_team  = parts[2] if len(parts) > 2 else "?"
-        both_teams = date_segment[7:] if len(parts) > 1 else ""
-        away_team  = both_teams.replace(home_team, "") if home_team != "?" else "?"
-
-        game_key = (date_str, tuple(sorted([home_team, away_team])))
+        game_key = (home_team, away_team) if home_team < away_team else (away_team, home_team)
         if game_key not in deduped:
             deduped[game_key] = {
                 "ticker":    ticker,
-                "date":      date_str,
+                "date":      today_str,
                 "home_team": home_team,
                 "away_team": away_team,
+                "match_key": match_key(today_str, norm.get(home_team, home_team),
+                                       norm.get(away_team, away_team)),
             }
 
     return list(deduped.values())
@@ -140,12 +266,10 @@ def _submit_order(
     dry_run:   bool,
 ) -> dict:
     """Low-level order placement. Assumes all guards have already passed."""
-    order_key = (ticker, side)
-
     if dry_run:
         print(f"  [DRY RUN] Would place: {side.upper()} {contracts} contracts "
               f"@ {ask_price}¢  ticker={ticker}")
-        _orders_placed.add(order_key)
+        _mark_traded(ticker, side)
         return {
             "status": "dry_run", "ticker": ticker, "side": side,
             "contracts": contracts, "price": ask_price,
@@ -163,7 +287,8 @@ def _submit_order(
             post_only     = True,
             **{price_kwarg: ask_price},
         )
-        _orders_placed.add(order_key)
+        _mark_traded(ticker, side)
+        bust_price_cache(ticker)
         print(f"  ✓ ORDER PLACED: {side.upper()} {contracts} @ {ask_price}¢  "
               f"ticker={ticker}  response={response}")
         return {
@@ -176,17 +301,14 @@ def _submit_order(
         return {"status": "failed", "ticker": ticker, "side": side, "error": str(e)}
 
 
-def maybe_trade(
-    client,
+def trade_allowed(
     ticker:    str,
     side:      str,
     entry:     dict,
     ask_price: int | float,
-    dry_run:   bool = False,
-) -> dict | None:
+) -> bool:
     """
-    Gate function: run all safety checks, then submit if everything passes.
-    Returns the order result dict, or None if any guard blocks the trade.
+    The safety checks maybe_trade() runs before submitting.
 
     Guards (all must pass):
         1. ask_price >= MIN_PRICE
@@ -198,22 +320,38 @@ def maybe_trade(
         7. (ticker, side) not already traded this session
     """
     if not isinstance(ask_price, (int, float)) or ask_price < MIN_PRICE:
-        print(f"  [BLOCKED] ask {ask_price}¢ below {MIN_PRICE}¢ floor")
-        return None
+        log.info("blocked: ask %s¢ below %s¢ floor", ask_price, MIN_PRICE)
+        return False
     if entry.get("contracts", 0) <= 0:
-        return None
+        return False
     if entry.get("raw_edge", 0) < MIN_EDGE:
-        return None
+        return False
     if entry.get("survival", 0) < MIN_SURVIVAL:
-        return None
+        return False
     if entry.get("score", 0) < 50:
-        return None
+        return False
 
     rec = entry.get("recommendation", "")
     if "SKIP" in rec or "WAIT" in rec:
-        return None
+        return False
+
+    return not _orders_placed.get(ticker, 0) & _SIDE_BIT[side]
+
 
-    if (ticker, side) in _orders_placed:
+def maybe_trade(
+    client,
+    ticker:    str,
+    side:      str,
+    entry:     dict,
+    ask_price: int | float,
+    dry_run:   bool = False,
+) -> dict | None:
+    """
+    Gate function: run all safety checks, then submit if everything passes.
+    Returns the order result dict, or None if any guard blocks the trade
+    (see trade_allowed()).
+    """
+    if not trade_allowed(ticker, side, entry, ask_price):
         return None
 
     return _submit_order(
@@ -224,3 +362,21 @@ def maybe_trade(
         contracts = entry["contracts"],
         dry_run   = dry_run,
     )
+
+
+def submit_orders(client, orders: list[dict], dry_run: bool = False) -> list[dict]:
+    """
+    Place several already-vetted orders (see trade_allowed()) at once.
+
+    Each order is a dict of ticker, side, ask_price and contracts. Live
+    orders go out concurrently on the shared pool, so a poll that fires N
+    trades waits about one round trip instead of N; dry runs stay serial so
+    their log lines keep the queue order. Returns results in input order.
+    """
+    def place(o: dict) -> dict:
+        return _submit_order(client, o["ticker"], o["side"],
+                             int(o["ask_price"]), o["contracts"], dry_run)
+
+    if dry_run or len(orders) < 2:
+        return [place(o) for o in orders]
+    return list(_POOL.map(place, orders))
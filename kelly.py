@@ -8,14 +8,16 @@
 #       true probability and a Kalshi ask price.
 
 import math
-from scipy.optimize import brentq
+from functools import lru_cache
 
 from config import BANKROLL, USE_MAKER, MAX_TRADE, MIN_PRICE
 from fees import kalshi_fee
+from jit import njit
 
 
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
+@njit(cache=True)
 def _log_return_moments(p: float, b: float, f: float) -> tuple[float, float]:
     """
     First two moments of the log-return distribution for a binary bet.
@@ -27,6 +29,7 @@ def _log_return_moments(p: float, b: float, f: float) -> tuple[float, float]:
     return mu, var
 
 
+@njit(cache=True)
 def _drawdown_prob(p: float, b: float, f: float,
                    D: float = 0.25, n_bets: int = 250) -> float:
     """
@@ -41,6 +44,93 @@ def _drawdown_prob(p: float, b: float, f: float,
     return p_ruin * horizon
 
 
+def _analytic_f_max(p: float, b: float, D: float, alpha: float,
+                    n_bets: int, f_star: float) -> float | None:
+    """
+    Closed-form drawdown root with the horizon term dropped.
+
+    With μ = f·A - f²·B/2 and σ² = f²·(B - A²), exp(-2μD/σ²) = alpha
+    reduces to μ/σ² = k, which is linear in f:  f0 = A / (k·(B - A²) + B/2).
+
+    The horizon factor (1 - exp(-n·μ)) only lowers the ruin probability, so
+    f0 is a lower bound on the exact root. Returns f0 if dropping that factor
+    moves the root by less than the 1e-6 solver tolerance (always, with
+    n_bets=0), else None.
+    """
+    q  = 1 - p
+    A  = b * p - q
+    B  = b**2 * p + q
+    C  = B - A**2
+    k  = -math.log(alpha) / (2 * D)
+    f0 = A / (k * C + B / 2)
+    if not 0 < f0 < f_star:
+        return None
+    if n_bets:
+        # First-order root shift: Δf ≈ -ln(horizon) / d(ln P)/df,
+        # with d(-2μD/σ²)/df = 2DA / (f²C)
+        mu, _   = _log_return_moments(p, b, f0)
+        horizon = 1 - math.exp(-n_bets * mu)
+        if horizon <= 0 or -math.log(horizon) * f0**2 * C / (2 * D * A) >= 1e-6:
+            return None
+    return f0
+
+
+@njit(cache=True)
+def _solve_f_max(p: float, b: float, D: float, alpha: float, n_bets: int,
+                 lo: float, hi: float, xtol: float) -> float:
+    """
+    Root of _drawdown_prob(f) = alpha on [lo, hi] by Brent's method.
+
+    A line-for-line port of scipy.optimize.brentq (same steps, rtol=4·eps,
+    100 iterations), so results match it exactly without importing SciPy;
+    compiled only when the JIT is opted into (see jit.py). Returns NaN if
+    [lo, hi] doesn't bracket a root.
+    """
+    rtol = 8.881784197001252e-16
+    xpre, xcur = lo, hi
+    fpre = _drawdown_prob(p, b, xpre, D, n_bets) - alpha
+    fcur = _drawdown_prob(p, b, xcur, D, n_bets) - alpha
+    if fpre == 0:
+        return xpre
+    if fcur == 0:
+        return xcur
+    if (fpre < 0) == (fcur < 0):
+        return math.nan
+
+    xblk = fblk = spre = scur = 0.0
+    for _ in range(100):
+        if fpre != 0 and fcur != 0 and (fpre < 0) != (fcur < 0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (xtol + rtol * abs(xcur)) / 2
+        sbis  = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta:
+            return xcur
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)      # secant
+            else:
+                dpre = (fpre - fcur) / (xpre - xcur)              # inverse quadratic
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+
+        xpre, fpre = xcur, fcur
+        xcur += scur if abs(scur) > delta else (delta if sbis > 0 else -delta)
+        fcur = _drawdown_prob(p, b, xcur, D, n_bets) - alpha
+    return xcur
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def max_kelly_for_drawdown_constraint(
@@ -55,7 +145,22 @@ def max_kelly_for_drawdown_constraint(
 
     Returns a dict with keys:
         valid, f_max, f_star, kelly_multiplier, drawdown_prob, reason
+
+    Solves are memoized on the exact arguments. p comes from whole-percent
+    ESPN WP and b from whole-cent asks, so the key space is already small.
     """
+    return dict(_max_kelly_cached(p, b, D, confidence, n_bets))
+
+
+@lru_cache(maxsize=8192)
+def _max_kelly_cached(
+    p:          float,
+    b:          float,
+    D:          float,
+    confidence: float,
+    n_bets:     int,
+) -> dict:
+    """Uncached body of max_kelly_for_drawdown_constraint()."""
     alpha  = 1 - confidence
     f_star = (b * p - (1 - p)) / b
 
@@ -65,26 +170,26 @@ def max_kelly_for_drawdown_constraint(
             "f_max": 0.0, "f_star": f_star, "kelly_multiplier": 0.0,
         }
 
-    if _drawdown_prob(p, b, f_star, D, n_bets) <= alpha:
+    dd_star = _drawdown_prob(p, b, f_star, D, n_bets)
+    if dd_star <= alpha:
         return {
             "valid":            True,
             "f_max":            round(f_star, 4),
             "f_star":           round(f_star, 4),
             "kelly_multiplier": 1.0,
-            "drawdown_prob":    round(_drawdown_prob(p, b, f_star, D, n_bets), 4),
+            "drawdown_prob":    round(dd_star, 4),
             "reason":           "full Kelly satisfies constraint",
         }
 
-    try:
-        f_max = brentq(
-            lambda f: _drawdown_prob(p, b, f, D, n_bets) - alpha,
-            1e-6, f_star, xtol=1e-6,
-        )
-    except ValueError:
-        return {
-            "valid": False, "reason": "no solution",
-            "f_max": 0.0, "f_star": f_star, "kelly_multiplier": 0.0,
-        }
+    f_max = _analytic_f_max(p, b, D, alpha, n_bets, f_star)
+    if f_max is None:
+        f_lo  = _analytic_f_max(p, b, D, alpha, 0, f_star) or 1e-6
+        f_max = _solve_f_max(p, b, D, alpha, n_bets, f_lo, f_star, 1e-6)
+        if math.isnan(f_max):
+            return {
+                "valid": False, "reason": "no solution",
+                "f_max": 0.0, "f_star": f_star, "kelly_multiplier": 0.0,
+            }
 
     return {
         "valid":            True,
@@ -108,7 +213,21 @@ def full_kelly(
 
     Returns a dict with keys:
         valid, reason, f_star, contracts, dollars, ev
+
+    Memoized on the exact arguments, like max_kelly_for_drawdown_constraint():
+    between polls ESPN WP and the ask usually haven't moved.
     """
+    return dict(_full_kelly_cached(true_probability, kalshi_ask, bankroll, maker))
+
+
+@lru_cache(maxsize=4096)
+def _full_kelly_cached(
+    true_probability: float | None,
+    kalshi_ask:       float | int | None,
+    bankroll:         float,
+    maker:            bool,
+) -> dict:
+    """Uncached body of full_kelly()."""
     if true_probability is None or kalshi_ask is None:
         return {
             "valid": False, "reason": "missing data",
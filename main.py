@@ -9,40 +9,74 @@
 # Usage:
 #   python main.py            # dry run (default)
 #   python main.py --live     # real orders
+#   python main.py -v         # also show per-side guard blocks
+#   python main.py --debug    # also show raw Kalshi prices per game
 
 import argparse
-import json
 import datetime
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
 
 import pandas as pd
-import pytz
-from dateutil import parser as dateutil_parser
 
 from config import KALSHI_SERIES, DRY_RUN
-from kalshi_client import get_kalshi_client
+from espn import get_live_states_bulk
+from jsonio import load_file
+from kalshi_client import get_kalshi_client, refresh_prices
 from merge import merge_games
-from display import print_and_trade
+from display import flush_orders, print_and_trade, score_slate
 
 
 LEAGUES = list(KALSHI_SERIES.keys())
-EASTERN = pytz.timezone("US/Eastern")
+EASTERN = ZoneInfo("US/Eastern")
+NEVER   = pd.Timestamp("9999-12-30 23:59").tz_localize(EASTERN)  # missing/unparseable time
 
 
 def load_json(path: str) -> list[dict]:
-    with open(path) as f:
-        return json.load(f)
-
-
-def game_time_est(row) -> datetime.datetime:
-    """Parse scheduled game time to Eastern; returns max datetime if missing."""
-    t = row.get("time")
-    if not t:
-        return datetime.datetime.max.replace(tzinfo=EASTERN)
-    try:
-        return dateutil_parser.parse(t).astimezone(EASTERN)
-    except Exception:
-        return datetime.datetime.max.replace(tzinfo=EASTERN)
+    return load_file(path)
+
+
+# ── League data ───────────────────────────────────────────────────────────────
+
+# The game files only change when get_*_games.py rerun, so a long-running
+# poller parses and merges each league once per rewrite, not every cycle.
+_LOADED: dict[str, tuple[tuple, list, list]] = {}          # league → (mtimes, espn, kalshi)
+_MERGED: dict[str, tuple[list, list, pd.DataFrame]] = {}   # league → (espn, kalshi, merged)
+
+
+def load_league(league: str) -> tuple[list[dict], list[dict]]:
+    """
+    (espn_games, kalshi_games) for league, re-read only when either JSON
+    file's mtime changes. Raises FileNotFoundError if one is missing.
+    """
+    paths  = (f"espn_games_{league}.json", f"kalshi_games_{league}.json")
+    mtimes = tuple(os.stat(p).st_mtime_ns for p in paths)
+    hit    = _LOADED.get(league)
+    if hit is None or hit[0] != mtimes:
+        hit = _LOADED[league] = (mtimes, load_json(paths[0]), load_json(paths[1]))
+    return hit[1], hit[2]
+
+
+def merge_league(league: str, espn_games: list[dict], kalshi_games: list[dict]) -> pd.DataFrame:
+    """
+    merge_games() sorted by parsed start time (_game_time), memoized until
+    load_league() returns freshly read lists. Unmatched games are logged on
+    the first merge only.
+    """
+    hit = _MERGED.get(league)
+    if hit is None or hit[0] is not espn_games or hit[1] is not kalshi_games:
+        merged = merge_games(espn_games, kalshi_games, league)
+        if not merged.empty:
+            # ESPN emits strict ISO 8601, so one vectorized parse covers the column
+            merged["_game_time"] = pd.to_datetime(
+                merged["time"], format="ISO8601", utc=True, errors="coerce",
+            ).dt.as_unit("us").dt.tz_convert(EASTERN).fillna(NEVER)
+            merged = merged.sort_values("_game_time")
+        hit = _MERGED[league] = (espn_games, kalshi_games, merged)
+    return hit[2]
 
 
 def run(dry_run: bool) -> None:
@@ -51,8 +85,7 @@ def run(dry_run: bool) -> None:
 
     for league in LEAGUES:
         try:
-            espn_games   = load_json(f"espn_games_{league}.json")
-            kalshi_games = load_json(f"kalshi_games_{league}.json")
+            espn_games, kalshi_games = load_league(league)
         except FileNotFoundError as e:
             print(f"[{league}] Missing data file: {e}  "
                   f"— run get_espn_games.py and get_kalshi_games.py first.")
@@ -63,34 +96,68 @@ def run(dry_run: bool) -> None:
               f"{len(espn_games)} ESPN games, {len(kalshi_games)} Kalshi markets")
         print(f"{'='*60}")
 
-        merged = merge_games(espn_games, kalshi_games, league)
+        merged = merge_league(league, espn_games, kalshi_games)
         if merged.empty:
             print(f"  No matched games for {league}")
             continue
 
-        merged["_game_time"] = merged.apply(game_time_est, axis=1)
-        merged = merged.sort_values("_game_time")
-
-        for _, row in merged.iterrows():
-            game_time = row.get("_game_time")
-            if game_time and now_est < game_time:
-                print(
-                    f"Game {row['game_id']}: {row['home_team']} vs {row['away_team']}  "
-                    f"—  {game_time.strftime('%m/%d - %I:%M %p EST')} (Not started)"
-                )
-                print("-" * 60)
-                print()
-                continue
-
-            print_and_trade(row, client, league=league, dry_run=dry_run)
+        # Games sort by start time, so every started game precedes every
+        # not-started one and splitting on a mask keeps the print order
+        not_started = merged["_game_time"] > now_est
+        active      = merged[~not_started]
+
+        # Fetch ESPN state and Kalshi prices for every started game up front,
+        # both sources concurrently (per-game ESPN calls, batched Kalshi quotes)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            states_f = pool.submit(
+                get_live_states_bulk, active["game_id"].tolist(), league)
+            prices_f = pool.submit(
+                refresh_prices, client, active["ticker"].tolist())
+            live_states, live_prices = states_f.result(), prices_f.result()
+
+        # Score every in-progress side of the slate in one vectorized pass.
+        # Plain dict rows: display only subscripts them, and iterrows() would
+        # build a dtype-coerced Series per game
+        rows  = active.to_dict("records")
+        slate = score_slate(rows, league, live_states, live_prices)
+
+        # Trades are queued while printing and submitted together afterwards
+        orders: list[dict] = []
+        for row in rows:
+            print_and_trade(row, client, league=league, dry_run=dry_run,
+                            espn=live_states.get(row["game_id"]),
+                            prices=live_prices.get(row["ticker"]),
+                            entries=slate.get(row["game_id"]),
+                            orders=orders)
+        flush_orders(client, orders, dry_run=dry_run)
+
+        pending = merged[not_started]
+        for game_id, home, away, game_time in zip(
+                pending["game_id"], pending["home_team"],
+                pending["away_team"], pending["_game_time"]):
+            print(f"Game {game_id}: {home} vs {away}  "
+                  f"—  {game_time.strftime('%m/%d - %I:%M %p EST')} (Not started)")
+            print("-" * 60)
+            print()
 
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Kalshi live trading loop")
     ap.add_argument("--live", action="store_true",
                     help="Place real orders (default: dry run)")
+    ap.add_argument("-v", "--verbose", action="store_true",
+                    help="Log per-side trade guard blocks")
+    ap.add_argument("--debug", action="store_true",
+                    help="Log raw Kalshi prices per game")
     args = ap.parse_args()
 
+    logging.basicConfig(
+        format="  [%(levelname)s] %(message)s",
+        level=(logging.DEBUG if args.debug else
+               logging.INFO if args.verbose else
+               logging.WARNING),
+    )
+
     effective_dry_run = not args.live
     if not effective_dry_run:
         confirm = input("⚠️  LIVE MODE — type 'yes' to confirm: ")
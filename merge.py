@@ -2,12 +2,26 @@
 # Joins ESPN and Kalshi game lists into a single DataFrame.
 #
 # The tricky part: Kalshi tickers encode the YES-team as the "home" team,
-# which may not match ESPN's home/away assignment. The frozenset key approach
-# handles swaps gracefully.
+# which may not match ESPN's home/away assignment. Matching on an
+# order-independent key (date + sorted teams) handles swaps gracefully.
 
+import numpy as np
 import pandas as pd
 
-from teams import normalize_kalshi_code
+from teams import get_normalization_map
+
+
+def _match_key(df: pd.DataFrame) -> pd.Series:
+    """'date|A|B' with the two team codes in sorted order, vectorized."""
+    home, away = df["home_team"], df["away_team"]
+    first  = np.where(home <= away, home, away)
+    second = np.where(home <= away, away, home)
+    return df["date"] + "|" + first + "|" + second
+
+
+def _has_match_keys(df: pd.DataFrame) -> bool:
+    """True if the writer already stored teams.match_key() on every row."""
+    return "match_key" in df.columns and df["match_key"].notna().all()
 
 
 def merge_games(
@@ -16,46 +30,48 @@ def merge_games(
     league:       str,
 ) -> pd.DataFrame:
     """
-    Match ESPN games to Kalshi markets by (date, frozenset({home, away})).
+    Match ESPN games to Kalshi markets by (date, {home, away}).
 
-    Normalizes Kalshi team codes to ESPN codes before matching.
+    Joins on each row's match_key (see teams.match_key), computing it from
+    the team codes when absent, with Kalshi codes normalized to ESPN first.
     Logs unmatched games to stdout.
 
-    Returns a DataFrame with columns from both sources.
-    Unmatched games are silently dropped (logged but not raised).
+    Returns a DataFrame with columns from both sources, in ESPN order, with
+    home/away aligned to ESPN. Unmatched games are dropped (logged, not raised).
     """
-    # Normalize Kalshi codes to ESPN equivalents
-    for g in kalshi_games:
-        g["home_team"] = normalize_kalshi_code(g["home_team"], league)
-        g["away_team"] = normalize_kalshi_code(g["away_team"], league)
-
-    # Build a lookup: (date, frozenset(teams)) → kalshi row
-    kalshi_lookup: dict = {}
-    for g in kalshi_games:
-        key = (g["date"], frozenset([g["home_team"], g["away_team"]]))
-        kalshi_lookup[key] = g
-
-    merged_rows = []
-    for espn_row in espn_games:
-        key        = (espn_row["date"],
-                      frozenset([espn_row["home_team"], espn_row["away_team"]]))
-        kalshi_row = kalshi_lookup.get(key)
-
-        if kalshi_row is None:
-            print(f"  [NO MATCH] {espn_row['home_team']} vs "
-                  f"{espn_row['away_team']} on {espn_row['date']}")
-            continue
-
-        # If Kalshi home/away is swapped relative to ESPN, align to ESPN
-        if (espn_row["home_team"] != kalshi_row["home_team"] or
-                espn_row["away_team"] != kalshi_row["away_team"]):
-            kalshi_row = dict(kalshi_row)
-            kalshi_row["home_team"], kalshi_row["away_team"] = (
-                kalshi_row["away_team"], kalshi_row["home_team"])
-
-        merged_rows.append({**espn_row, **kalshi_row})
-
-    if not merged_rows:
+    if not espn_games:
+        return pd.DataFrame()
+
+    # get_*_games.py store match_key on every row; older files fall back to
+    # computing it here
+    espn_df = pd.DataFrame(espn_games)
+    if not _has_match_keys(espn_df):
+        espn_df["match_key"] = _match_key(espn_df)
+
+    if kalshi_games:
+        kalshi_df = pd.DataFrame(kalshi_games)
+        if not _has_match_keys(kalshi_df):
+            # Normalize Kalshi codes to ESPN equivalents: one map lookup per
+            # column, unknown codes kept as-is
+            norm = get_normalization_map(league)
+            for col in ("home_team", "away_team"):
+                codes          = kalshi_df[col].astype(str).str.upper()
+                kalshi_df[col] = codes.map(norm).fillna(codes)
+            kalshi_df["match_key"] = _match_key(kalshi_df)
+        # One market per matchup; the last one listed wins
+        kalshi_df = kalshi_df.drop_duplicates("match_key", keep="last")
+    else:
+        kalshi_df = pd.DataFrame(columns=["match_key"])
+
+    unmatched = espn_df.loc[~espn_df["match_key"].isin(kalshi_df["match_key"])]
+    for home, away, date in zip(unmatched["home_team"], unmatched["away_team"], unmatched["date"]):
+        print(f"  [NO MATCH] {home} vs {away} on {date}")
+
+    # date/home/away agree (up to a swap) on matched rows, so keep ESPN's
+    # orientation and only bring over Kalshi-only columns
+    extra  = [c for c in kalshi_df.columns if c not in espn_df.columns]
+    merged = espn_df.merge(kalshi_df[["match_key", *extra]], on="match_key", how="inner")
+    if merged.empty:
         return pd.DataFrame()
 
-    return pd.DataFrame(merged_rows)
+    return merged.drop(columns="match_key")
@@ -1,28 +1,47 @@
 # teams.py
 # Team code normalization between Kalshi tickers and ESPN identifiers.
 
-from config import KALSHI_TO_ESPN
+from functools import lru_cache
+from types import MappingProxyType
 
+from config import KALSHI_TO_ESPN, TEAM_MAP_LEAGUE
 
-def _league_map(league: str) -> dict:
-    """Return the correct sub-map for a given league string."""
-    # Use 'nba' for NBA, 'ncaa' for all college basketball leagues
-    if league == "nba":
-        key = "nba"
-    elif league in ("ncaabbm", "ncaabbw"):
-        key = "ncaa"
-    else:
-        key = league
-    return KALSHI_TO_ESPN.get(key, {})
+_NO_MAP = MappingProxyType({})
 
+# league → its Kalshi → ESPN map, resolved once instead of via TEAM_MAP_LEAGUE
+# on every call (ncaabbm and ncaabbw share the NCAA map)
+_LEAGUE_SUBMAP = MappingProxyType({
+    league: KALSHI_TO_ESPN.get(map_key, _NO_MAP)
+    for league, map_key in TEAM_MAP_LEAGUE.items()
+})
 
+
+@lru_cache(maxsize=2048)
 def normalize_kalshi_code(code: str, league: str) -> str:
     """
     Translate a Kalshi team code to its ESPN equivalent.
-    Unknown codes are returned unchanged (uppercase).
+    Unknown codes are returned unchanged (uppercase). Memoized: display
+    normalizes the same few dozen codes for every game on every poll.
     """
     code = str(code).upper()
-    return _league_map(league).get(code, code)
+    return _LEAGUE_SUBMAP.get(league, _NO_MAP).get(code, code)
+
+
+def get_normalization_map(league: str) -> MappingProxyType:
+    """
+    The Kalshi → ESPN code map for one league (read-only, uppercase keys),
+    for callers normalizing many codes at once. Empty for unknown leagues.
+    """
+    return _LEAGUE_SUBMAP.get(league, _NO_MAP)
+
+
+def match_key(date: str, home: str, away: str) -> str:
+    """
+    Order-independent join key for one game: 'date|A|B' with A <= B.
+    Pass ESPN codes (normalize Kalshi codes first) so both sides agree.
+    """
+    a, b = (home, away) if home <= away else (away, home)
+    return f"{date}|{a}|{b}"
 
 
 def get_yes_team_from_ticker(ticker: str) -> str:
@@ -30,4 +49,14 @@ def get_yes_team_from_ticker(ticker: str) -> str:
     Extract the YES-side team code from a Kalshi market ticker.
     e.g. 'KXNBAGAME-26FEB25BKNLAC-BKN' → 'BKN'
     """
-    return ticker.split("-")[-1].upper()
+    return ticker.rpartition("-")[2].upper()
+
+
+def yes_team_espn(ticker: str, league: str) -> str:
+    """
+    The YES-side team of a Kalshi ticker as an ESPN code — i.e.
+    normalize_kalshi_code(get_yes_team_from_ticker(ticker), league) in one
+    partition and one map lookup.
+    """
+    code = ticker.rpartition("-")[2].upper()
+    return _LEAGUE_SUBMAP.get(league, _NO_MAP).get(code, code)
@@ -0,0 +1,8 @@
+# tests/conftest.py
+# Runs once per session, before test modules are collected: puts the
+# project root on sys.path so tests import modules as `from fees import ...`.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
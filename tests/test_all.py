@@ -0,0 +1,783 @@
+#!/usr/bin/env python3
+# tests/test_all.py
+# Unit tests for all pure-logic modules: fees, kelly, entry, teams, espn parsing.
+#
+# Run from the project root:
+#   python -m pytest tests/ -v
+#
+# No network calls, no Kalshi credentials required.
+
+import os
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# fees.py
+# ─────────────────────────────────────────────────────────────────────────────
+
+from fees import kalshi_fee
+
+class TestKalshiFee:
+    def test_taker_fee_symmetric_at_50(self):
+        # Fee is symmetric around 50¢; max at 50¢
+        fee_50  = kalshi_fee(100, 50, maker=False)
+        fee_50b = kalshi_fee(100, 0.50, maker=False)
+        assert fee_50 == fee_50b
+
+    def test_maker_fee_lower_than_taker(self):
+        assert kalshi_fee(10, 80, maker=True) < kalshi_fee(10, 80, maker=False)
+
+    def test_fee_rounds_up(self):
+        # Result must always be >= the raw value
+        fee = kalshi_fee(1, 82, maker=False)
+        assert fee > 0
+
+    def test_price_accepts_cents_or_decimal(self):
+        assert kalshi_fee(10, 75, maker=False) == kalshi_fee(10, 0.75, maker=False)
+
+    def test_zero_contracts(self):
+        assert kalshi_fee(0, 80) == 0.0
+
+    def test_fee_near_zero_at_extremes(self):
+        # P*(1-P) → 0 as price → 0 or 1
+        assert kalshi_fee(100, 99, maker=False) < kalshi_fee(100, 75, maker=False)
+        assert kalshi_fee(100, 1,  maker=False) < kalshi_fee(100, 50, maker=False)
+
+    @pytest.mark.parametrize("maker", [False, True])
+    def test_matches_decimal_reference(self, maker):
+        # The float formula must round to the same cent as exact Decimal math
+        from decimal import Decimal, ROUND_CEILING
+        rate = Decimal("0.0175") if maker else Decimal("0.07")
+        for price in range(2, 100):     # a bare 1 reads as $1.00, not 1¢
+            p = Decimal(price) / 100
+            for contracts in range(1, 1001):
+                exact = (rate * contracts * p * (1 - p)).quantize(
+                    Decimal("0.01"), rounding=ROUND_CEILING)
+                assert kalshi_fee(contracts, price, maker=maker) == float(exact)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# kelly.py
+# ─────────────────────────────────────────────────────────────────────────────
+
+from kelly import max_kelly_for_drawdown_constraint, full_kelly
+from kelly import _drawdown_prob, _solve_f_max
+
+class TestMaxKelly:
+    def test_no_edge_returns_invalid(self):
+        result = max_kelly_for_drawdown_constraint(p=0.40, b=0.50)
+        assert not result["valid"]
+        assert result["f_max"] == 0.0
+
+    def test_positive_edge_returns_valid(self):
+        result = max_kelly_for_drawdown_constraint(p=0.85, b=0.20)
+        assert result["valid"]
+        assert 0 < result["f_max"] <= result["f_star"]
+
+    def test_f_max_leq_f_star(self):
+        result = max_kelly_for_drawdown_constraint(p=0.90, b=0.15)
+        if result["valid"]:
+            assert result["f_max"] <= result["f_star"]
+
+    def test_multiplier_between_0_and_1(self):
+        result = max_kelly_for_drawdown_constraint(p=0.85, b=0.20)
+        if result["valid"]:
+            assert 0 <= result["kelly_multiplier"] <= 1.0
+
+    @pytest.mark.parametrize("n_bets", [25, 250, 10_000])
+    def test_constraint_binds_on_both_solve_paths(self, n_bets):
+        # 10k bets takes the closed-form path; shorter horizons fall back to brentq
+        result = max_kelly_for_drawdown_constraint(p=0.90, b=0.15, n_bets=n_bets)
+        assert result["reason"] == "constrained by drawdown limit"
+        assert result["drawdown_prob"] == pytest.approx(0.05, abs=1e-4)
+
+    @pytest.mark.parametrize("p,b", [(0.90, 0.15), (0.80, 0.30), (0.95, 0.05)])
+    def test_solver_matches_scipy_brentq(self, p, b):
+        brentq = pytest.importorskip("scipy.optimize").brentq
+        f_star = (b * p - (1 - p)) / b
+        expect = brentq(lambda f: _drawdown_prob(p, b, f, 0.25, 250) - 0.05,
+                        1e-6, f_star, xtol=1e-6)
+        assert _solve_f_max(p, b, 0.25, 0.05, 250, 1e-6, f_star, 1e-6) == expect
+
+
+class TestFullKelly:
+    def test_missing_inputs_invalid(self):
+        assert not full_kelly(None, 82)["valid"]
+        assert not full_kelly(0.85, None)["valid"]
+
+    def test_below_min_price_invalid(self):
+        result = full_kelly(0.95, 20)   # 20¢ — below MIN_PRICE
+        assert not result["valid"]
+        assert "below target zone" in result["reason"]
+
+    def test_positive_ev_for_strong_edge(self):
+        result = full_kelly(0.90, 82)
+        if result["valid"]:
+            assert result["ev"] > 0
+            assert result["contracts"] > 0
+
+    def test_contracts_respect_position_limit(self):
+        # With a small bankroll the dollar cap should limit contracts
+        result = full_kelly(0.90, 82, bankroll=10.0)
+        if result["valid"]:
+            assert result["dollars"] <= 10.0
+
+    def test_cached_result_is_a_copy(self):
+        first = full_kelly(0.90, 82)
+        first["contracts"] = -1
+        assert full_kelly(0.90, 82)["contracts"] != -1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# entry.py
+# ─────────────────────────────────────────────────────────────────────────────
+
+from entry import (
+    clear_entry_cache, entry_quality, entry_quality_batch,
+    is_effectively_locked, wp_survival_probability,
+)
+import entry
+
+class TestIsEffectivelyLocked:
+    def test_large_lead_early_is_locked(self):
+        # Q2 blowout: +25 with 42 min remaining → need +13 → locked
+        assert is_effectively_locked(score_diff=25, seconds_remaining=42 * 60)
+
+    def test_small_lead_early_not_locked(self):
+        assert not is_effectively_locked(score_diff=5, seconds_remaining=42 * 60)
+
+    def test_q4_standard_lead_locked(self):
+        # Q4 5 min left, +3 lead → need 1.5 → locked
+        assert is_effectively_locked(score_diff=3, seconds_remaining=5 * 60)
+
+    def test_zero_seconds_always_locked(self):
+        assert is_effectively_locked(score_diff=0, seconds_remaining=0)
+
+    def test_q1_marginal(self):
+        # Q1 12 min left, +4 lead → need 3.6 → locked (barely)
+        assert is_effectively_locked(score_diff=4, seconds_remaining=12 * 60)
+        # +3 → need 3.6 → not locked
+        assert not is_effectively_locked(score_diff=3, seconds_remaining=12 * 60)
+
+
+class TestWpSurvivalProbability:
+    def test_high_wp_high_survival(self):
+        s = wp_survival_probability(0.95, 0.77, 120, 10)
+        assert s > 0.8
+
+    def test_floor_above_current_zero_survival(self):
+        s = wp_survival_probability(0.50, 0.90, 300, 2)
+        assert s < 0.10
+
+    def test_deep_in_the_money_saturates(self):
+        assert wp_survival_probability(0.99, 0.50, 60, 20) == 1.0
+        assert wp_survival_probability(0.20, 0.90, 60, -20) == 0.0
+
+    def test_no_time_remaining(self):
+        assert wp_survival_probability(0.90, 0.77, 0, 10) == 1.0
+        assert wp_survival_probability(0.70, 0.77, 0, 10) == 0.0
+
+
+class TestEntryQuality:
+    # ── Hard blocks ───────────────────────────────────────────────────────
+
+    def test_below_min_price_blocked(self):
+        eq = entry_quality(
+            p_current=0.95, kalshi_ask=50,    # 50¢ — below 75¢ floor
+            seconds_remaining=300, score_diff=10, period=4)
+        assert eq["contracts"] == 0
+        assert "SKIP" in eq["recommendation"]
+
+    def test_insufficient_edge_blocked(self):
+        eq = entry_quality(
+            p_current=0.80, kalshi_ask=78,    # 2% edge — below 6% min
+            seconds_remaining=300, score_diff=10, period=4)
+        assert eq["contracts"] == 0
+        assert "SKIP" in eq["recommendation"]
+
+    def test_q2_no_blowout_blocked(self):
+        # p=0.88, ask=78 → 10% edge (passes edge gate), small lead → period gate fires
+        eq = entry_quality(
+            p_current=0.88, kalshi_ask=78,
+            seconds_remaining=30 * 60, score_diff=5, period=2)
+        assert eq["contracts"] == 0
+        assert "WAIT" in eq["recommendation"]
+
+    def test_q2_blowout_allowed(self):
+        # Q2 with large enough lead should proceed to evaluation
+        eq = entry_quality(
+            p_current=0.90, kalshi_ask=80,
+            seconds_remaining=30 * 60, score_diff=20, period=2)
+        # May or may not trade depending on survival; just verify it's not period-blocked
+        assert "Q2 needs" not in eq["recommendation"]
+
+    # ── Good signal ───────────────────────────────────────────────────────
+
+    def test_strong_q4_signal_enters(self):
+        eq = entry_quality(
+            p_current=0.92, kalshi_ask=82,
+            seconds_remaining=120, score_diff=8, period=4)
+        assert eq["score"] > 0
+        # Contracts may be 0 if Kelly finds no room; score should be positive
+        assert eq["raw_edge"] > 0
+
+    def test_recommendation_not_skip_for_strong_signal(self):
+        eq = entry_quality(
+            p_current=0.92, kalshi_ask=82,
+            seconds_remaining=120, score_diff=8, period=4)
+        # A strong signal should at minimum not be a hard SKIP
+        assert "below target zone" not in eq["recommendation"]
+        assert "fee exceeds" not in eq["recommendation"]
+
+    # ── Return shape ──────────────────────────────────────────────────────
+
+    def test_return_has_all_keys(self):
+        eq = entry_quality(
+            p_current=0.85, kalshi_ask=79,
+            seconds_remaining=300, score_diff=7, period=4)
+        required = {
+            "valid", "score", "recommendation", "raw_edge", "survival",
+            "vol_remaining", "velocity", "f_max", "f_star",
+            "kelly_multiplier", "dollars", "contracts", "ev",
+        }
+        assert required.issubset(eq.keys())
+
+    def test_contracts_zero_when_skip(self):
+        # Any SKIP recommendation must have zero contracts
+        eq = entry_quality(
+            p_current=0.85, kalshi_ask=20,    # below price floor
+            seconds_remaining=300, score_diff=10, period=4)
+        assert eq["contracts"] == 0
+
+    # ── Batch scorer ──────────────────────────────────────────────────────
+
+    def test_batch_matches_scalar(self):
+        cases = [
+            # p,   ask, secs, diff, period
+            (0.92, 82,  120,   8,   4),
+            (0.88, 78,  1800,  5,   2),
+            (0.90, 80,  1800,  20,  2),
+            (0.85, 20,  300,   10,  4),
+            (0.95, 97,  0,     3,   5),
+            (0.9925, 95, 2289, 25,  2),     # off-grid p and clock get discretized
+            (0.9234, 82, 121,   8,   4),
+        ]
+        batch = entry_quality_batch(*zip(*cases))
+        for case, eq in zip(cases, batch):
+            assert eq == entry_quality(*case)
+
+    # ── Memoization ───────────────────────────────────────────────────────
+
+    @pytest.fixture
+    def cold_cache(self):
+        clear_entry_cache()
+        yield
+        clear_entry_cache()
+
+    def test_clear_entry_cache_forces_recompute(self, cold_cache):
+        kwargs = dict(p_current=0.92, kalshi_ask=82,
+                      seconds_remaining=120, score_diff=8, period=4)
+        with patch("entry._score_entry", wraps=entry._score_entry) as score:
+            entry_quality(**kwargs)
+            entry_quality(**kwargs)
+            clear_entry_cache()
+            entry_quality(**kwargs)
+        assert score.call_count == 2
+
+    def test_cached_result_is_a_copy(self):
+        kwargs = dict(p_current=0.92, kalshi_ask=82,
+                      seconds_remaining=120, score_diff=8, period=4)
+        first = entry_quality(**kwargs)
+        first["contracts"] = -1
+        assert entry_quality(**kwargs)["contracts"] != -1
+
+    def test_clock_bucketed_within_cache_window(self):
+        a = entry_quality(p_current=0.92, kalshi_ask=82,
+                          seconds_remaining=117, score_diff=8, period=4)
+        b = entry_quality(p_current=0.92, kalshi_ask=82,
+                          seconds_remaining=120, score_diff=8, period=4)
+        assert a == b
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# teams.py
+# ─────────────────────────────────────────────────────────────────────────────
+
+from config import KALSHI_TO_ESPN, TEAM_MAP_LEAGUE
+from teams import normalize_kalshi_code, get_yes_team_from_ticker, yes_team_espn
+
+class TestTeams:
+    def test_known_nba_mapping(self):
+        assert normalize_kalshi_code("BRK", "nba") == "BKN"
+        assert normalize_kalshi_code("GS",  "nba") == "GSW"
+        assert normalize_kalshi_code("NYK", "nba") == "NY"
+
+    def test_known_ncaa_mapping(self):
+        assert normalize_kalshi_code("CLT",  "ncaabbm") == "CHAR"
+        assert normalize_kalshi_code("BOIS", "ncaabbm") == "BSU"
+
+    def test_mapping_is_idempotent(self):
+        # display.py re-normalizes codes merge.py already normalized; a
+        # mapped ESPN code must never map onward (e.g. NY ↔ NYK)
+        for league, map_key in TEAM_MAP_LEAGUE.items():
+            for espn_code in KALSHI_TO_ESPN[map_key].values():
+                assert normalize_kalshi_code(espn_code, league) == espn_code
+
+    def test_unknown_code_passthrough(self):
+        assert normalize_kalshi_code("LAL", "nba") == "LAL"
+
+    def test_case_insensitive_input(self):
+        assert normalize_kalshi_code("brk", "nba") == "BKN"
+
+    def test_yes_team_from_ticker(self):
+        assert get_yes_team_from_ticker("KXNBAGAME-26FEB25BKNLAC-BKN") == "BKN"
+        assert get_yes_team_from_ticker("KXNBAGAME-26FEB25LACLAC-LAC") == "LAC"
+
+    def test_yes_team_last_segment(self):
+        ticker = "KXNCAAMBGAME-26FEB25DUKNC-DUK"
+        assert get_yes_team_from_ticker(ticker) == "DUK"
+
+    @pytest.mark.parametrize("ticker, league", [
+        ("KXNBAGAME-26FEB25BRKLAC-BRK",      "nba"),
+        ("KXNBAGAME-26FEB25NYKBOS-nyk",      "nba"),
+        ("KXNCAAMBGAME-26FEB25CLTDUK-CLT",   "ncaabbm"),
+        ("KXNCAAWBGAME-26FEB25BOISUNM-BOIS", "ncaabbw"),
+        ("KXNBAGAME-26FEB25BRKLAC-BRK",      "unknown"),
+    ])
+    def test_yes_team_espn_matches_composition(self, ticker, league):
+        expected = normalize_kalshi_code(get_yes_team_from_ticker(ticker), league)
+        assert yes_team_espn(ticker, league) == expected
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# espn.py  (clock parsing only — no network)
+# ─────────────────────────────────────────────────────────────────────────────
+
+from espn import _parse_seconds_remaining
+
+class TestClockParsing:
+    def test_mm_ss_format_q4(self):
+        # 5:00 left in Q4 — 0 quarters remaining after Q4
+        secs = _parse_seconds_remaining("5:00", period=4)
+        assert secs == 5 * 60
+
+    def test_mm_ss_format_q3(self):
+        # 10:00 left in Q3 — 1 quarter remaining (Q4 = 12 min)
+        secs = _parse_seconds_remaining("10:00", period=3)
+        assert secs == 10 * 60 + 12 * 60
+
+    def test_mm_ss_tenths_truncated(self):
+        secs = _parse_seconds_remaining("1:05.7", period=4)
+        assert secs == 65
+
+    def test_decimal_format(self):
+        secs = _parse_seconds_remaining("300", period=4)
+        assert secs == 300
+
+    def test_bad_format_returns_none(self):
+        secs = _parse_seconds_remaining("??:??", period=4)
+        assert secs is None
+
+    def test_q1_full_remaining(self):
+        # 12:00 left in Q1 → 12 min this quarter + 3 × 12 remaining
+        secs = _parse_seconds_remaining("12:00", period=1)
+        assert secs == 12 * 60 + 3 * 12 * 60
+
+
+import io
+import json
+import time
+from types import SimpleNamespace
+
+import espn
+
+
+def _summary_payload(period: int, clock: str) -> dict:
+    """Minimal ESPN summary response for an in-progress game."""
+    return {
+        "header": {"competitions": [{
+            "status": {
+                "period": period, "displayClock": clock,
+                "type": {"state": "in", "completed": False, "shortDetail": ""},
+            },
+            "competitors": [
+                {"homeAway": "away", "score": "90", "team": {"id": "2"}},
+                {"homeAway": "home", "score": "98", "team": {"id": "1"}},
+            ],
+        }]},
+        "winprobability": [{"homeWinPercentage": 0.5},
+                           {"homeWinPercentage": 0.91}],
+        "situation": {"possession": "2"},
+    }
+
+
+def _live_state_from_payload(data: dict) -> dict:
+    resp = MagicMock()
+    resp.content = json.dumps(data).encode()
+    resp.json.return_value = data
+    with patch.object(espn._SESSION, "get", return_value=resp):
+        return espn._fetch_live_state("1", "nba")
+
+
+class TestScoreboard:
+    PAYLOAD = {"events": [{
+        "id": "401", "shortName": "BOS @ NY", "date": "2026-02-25T00:30Z",
+        "status": {"type": {"name": "STATUS_SCHEDULED"}},
+    }]}
+
+    def test_parses_events(self):
+        resp = MagicMock()
+        resp.content = json.dumps(self.PAYLOAD).encode()
+        resp.raw     = io.BytesIO(resp.content)   # streamed path (ijson)
+        with patch.object(espn._SESSION, "get", return_value=resp):
+            games = espn.fetch_scoreboard("nba", date="20260224")
+        assert games[0]["game_id"] == "401"
+        assert (games[0]["home_team"], games[0]["away_team"]) == ("NY", "BOS")
+
+    def test_streams_events_when_ijson_available(self, monkeypatch):
+        def items(raw, prefix):
+            assert prefix == "events.item"
+            yield from json.load(raw)["events"]
+
+        monkeypatch.setattr(espn, "ijson", SimpleNamespace(items=items))
+        resp = MagicMock()
+        resp.raw = io.BytesIO(json.dumps(self.PAYLOAD).encode())
+        with patch.object(espn._SESSION, "get", return_value=resp) as get:
+            games = espn.fetch_scoreboard("nba", date="20260224")
+        assert get.call_args.kwargs["stream"] is True
+        assert resp.raw.decode_content is True
+        resp.close.assert_called_once()
+        assert [g["game_id"] for g in games] == ["401"]
+
+
+class TestLiveStateParsing:
+    def test_parses_in_game_summary(self):
+        state = _live_state_from_payload(_summary_payload(period=4, clock="5:00"))
+        assert state["game_state"] == "in"
+        assert state["period_str"] == "Q4"
+        assert (state["home_score"], state["away_score"]) == ("98", "90")
+        assert (state["home_wp"], state["away_wp"]) == (91, 9)
+        assert state["possession"] == "away"
+
+    def test_ot_period_label(self):
+        data  = _summary_payload(period=6, clock="3:10")
+        state = _live_state_from_payload(data)
+        assert state["period_str"] == "OT2"
+        assert state["seconds_remaining"] == 190
+
+
+class TestLiveStateCache:
+    def setup_method(self):
+        espn._live_cache.clear()
+
+    def test_repeat_call_within_ttl_uses_cache(self):
+        state = {"game_id": "1", "game_state": "in"}
+        with patch("espn._fetch_live_state", return_value=state) as fetch:
+            espn.get_live_state("1", "nba")
+            espn.get_live_state("1", "nba")
+        assert fetch.call_count == 1
+
+    def test_expired_entries_evicted_on_write(self):
+        espn._live_cache[("old", "nba")] = (time.monotonic() - espn.ESPN_LIVE_TTL - 1, {})
+        with patch("espn._fetch_live_state", return_value={"game_state": "in"}):
+            espn.get_live_state("1", "nba")
+        assert list(espn._live_cache) == [("1", "nba")]
+
+    def test_errors_not_cached(self):
+        state = {"game_id": "1", "game_state": "error", "error": "timeout"}
+        with patch("espn._fetch_live_state", return_value=state) as fetch:
+            espn.get_live_state("1", "nba")
+            espn.get_live_state("1", "nba")
+        assert fetch.call_count == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# merge.py
+# ─────────────────────────────────────────────────────────────────────────────
+
+from merge import merge_games
+from teams import match_key
+
+class TestMergeGames:
+    ESPN = [
+        {"game_id": "1", "home_team": "LAC", "away_team": "BKN", "date": "2026-02-25"},
+        {"game_id": "2", "home_team": "MIA", "away_team": "BOS", "date": "2026-02-25"},
+    ]
+
+    def test_swapped_kalshi_side_aligned_to_espn(self):
+        kalshi = [{"ticker": "T-BRK", "date": "2026-02-25",
+                   "home_team": "BRK", "away_team": "LAC"}]
+        merged = merge_games(self.ESPN, kalshi, "nba")
+        assert merged.to_dict("records") == [{
+            "game_id": "1", "home_team": "LAC", "away_team": "BKN",
+            "date": "2026-02-25", "ticker": "T-BRK",
+        }]
+
+    def test_joins_on_stored_match_keys(self):
+        espn   = [dict(g, match_key=match_key(g["date"], g["home_team"], g["away_team"]))
+                  for g in self.ESPN]
+        kalshi = [{"ticker": "T-BRK", "date": "2026-02-25", "home_team": "BRK",
+                   "away_team": "LAC", "match_key": "2026-02-25|BKN|LAC"}]
+        merged = merge_games(espn, kalshi, "nba")
+        assert list(merged["ticker"]) == ["T-BRK"]
+        assert "match_key" not in merged.columns
+
+    def test_no_match_returns_empty(self, capsys):
+        merged = merge_games(self.ESPN, [], "nba")
+        assert merged.empty
+        assert capsys.readouterr().out.count("[NO MATCH]") == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# display.py  (slate scoring)
+# ─────────────────────────────────────────────────────────────────────────────
+
+from display import score_slate
+
+class TestScoreSlate:
+    ROW    = {"game_id": "1", "ticker": "KXNBAGAME-X-NYK",
+              "home_team": "NY", "away_team": "BKN"}
+    PRICES = {"yes_bid": 80, "yes_ask": 82, "no_bid": 17, "no_ask": 19}
+
+    def _state(self, game_state="in"):
+        return {"game_state": game_state, "home_wp": 92, "away_wp": 8,
+                "home_score": "100", "away_score": "90", "period": 4,
+                "seconds_remaining": 120}
+
+    def test_matches_scalar_entry_quality(self):
+        slate = score_slate([self.ROW], "nba", {"1": self._state()}, {self.ROW["ticker"]: self.PRICES})
+        home, away = slate["1"]
+        # YES is NYK → NY, the home side
+        assert home == entry_quality(0.92, 82, 120, 10, 4)
+        assert away == entry_quality(0.08, 19, 120, -10, 4)
+
+    def test_only_in_progress_games_scored(self):
+        slate = score_slate([self.ROW], "nba", {"1": self._state("pre")}, {self.ROW["ticker"]: self.PRICES})
+        assert slate == {}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# kalshi_client.py  (maybe_trade — no network)
+# ─────────────────────────────────────────────────────────────────────────────
+
+from kalshi_client import maybe_trade, reset_session, submit_orders
+
+class _StubClient:
+    """Stands in for the Kalshi client where dry runs never touch it."""
+    __slots__ = ()
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One shared client for dry-run maybe_trade tests — they never call it."""
+    return _StubClient()
+
+
+class TestMaybeTrade:
+    """All tests use dry_run=True so no real orders fire."""
+
+    # A tradeable entry; tests copy it with overrides, never mutate it
+    _TEMPLATE = {
+        "contracts": 5, "raw_edge": 0.10, "survival": 0.85,
+        "score": 65, "recommendation": "ENTER",
+        "f_max": 0.05, "f_star": 0.08, "kelly_multiplier": 0.6,
+        "dollars": 14.0, "ev": 1.20, "vol_remaining": 0.04, "velocity": 0.8,
+        "valid": True,
+    }
+
+    def _good_entry(self, **overrides) -> dict:
+        return {**self._TEMPLATE, **overrides}
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_session()
+
+    def test_good_entry_passes(self, client):
+        result = maybe_trade(client, "TICKER-A", "yes",
+                             self._good_entry(), ask_price=82, dry_run=True)
+        assert result is not None
+        assert result["status"] == "dry_run"
+
+    @pytest.mark.parametrize("overrides, ask_price", [
+        pytest.param({}, 50, id="below_price_floor"),
+        pytest.param({"contracts": 0}, 82, id="zero_contracts"),
+        pytest.param({"raw_edge": 0.02}, 82, id="low_edge"),
+        pytest.param({"survival": 0.50}, 82, id="low_survival"),
+        pytest.param({"score": 30}, 82, id="low_score"),
+        pytest.param({"recommendation": "SKIP — below target zone"}, 82, id="skip_recommendation"),
+        pytest.param({"recommendation": "WAIT — Q2 needs +13pt lead"}, 82, id="wait_recommendation"),
+    ])
+    def test_guard_blocks(self, client, overrides, ask_price):
+        result = maybe_trade(client, "TICKER-A", "yes",
+                             self._good_entry(**overrides), ask_price=ask_price, dry_run=True)
+        assert result is None
+
+    def test_duplicate_blocked(self, client):
+        # First trade should succeed
+        r1 = maybe_trade(client, "TICKER-DUP", "yes",
+                         self._good_entry(), ask_price=82, dry_run=True)
+        assert r1 is not None
+        # Second trade same ticker+side should be blocked
+        r2 = maybe_trade(client, "TICKER-DUP", "yes",
+                         self._good_entry(), ask_price=82, dry_run=True)
+        assert r2 is None
+
+    def test_other_side_of_traded_ticker_allowed(self, client):
+        assert maybe_trade(client, "TICKER-DUP", "yes",
+                           self._good_entry(), ask_price=82, dry_run=True) is not None
+        assert maybe_trade(client, "TICKER-DUP", "no",
+                           self._good_entry(), ask_price=82, dry_run=True) is not None
+
+    def test_submit_orders_places_all_in_order(self):
+        client = MagicMock()
+        orders = [{"ticker": f"TICKER-{i}", "side": "yes", "ask_price": 82, "contracts": 5}
+                  for i in range(4)]
+        results = submit_orders(client, orders, dry_run=False)
+        assert [r["ticker"] for r in results] == [o["ticker"] for o in orders]
+        assert all(r["status"] == "placed" for r in results)
+        assert client.create_order.call_count == 4
+        # Placed orders count toward the duplicate guard
+        assert maybe_trade(client, "TICKER-2", "yes",
+                           self._good_entry(), ask_price=82, dry_run=True) is None
+
+    def test_submit_orders_failure_not_marked_traded(self):
+        client = MagicMock()
+        client.create_order.side_effect = RuntimeError("rejected")
+        orders = [{"ticker": "TICKER-F", "side": "no", "ask_price": 82, "contracts": 5}] * 2
+        assert [r["status"] for r in submit_orders(client, orders)] == ["failed"] * 2
+        assert maybe_trade(client, "TICKER-F", "no",
+                           self._good_entry(), ask_price=82, dry_run=True) is not None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# kalshi_client.py  (get_league_games — mocked client)
+# ─────────────────────────────────────────────────────────────────────────────
+
+from datetime import datetime
+import kalshi_client
+from kalshi_client import get_league_games, _parse_ticker_date, get_yes_no_prices
+
+class TestLeagueGames:
+    def _client(self, *tickers):
+        client = MagicMock()
+        client.get_markets.return_value.markets = [MagicMock(ticker=t) for t in tickers]
+        return client
+
+    def test_ticker_date_parsing(self):
+        assert _parse_ticker_date("26FEB25") == "2026-02-25"
+        assert _parse_ticker_date("26FOO25") == "?"
+        assert _parse_ticker_date("") == "?"
+
+    def test_today_only_and_deduped(self):
+        seg    = datetime.today().strftime("%y%b%d").upper()
+        client = self._client(f"KXNBAGAME-{seg}BKNLAC-LAC",
+                              f"KXNBAGAME-{seg}BKNLAC-BKN",
+                              "KXNBAGAME-20JAN01BKNLAC-LAC",
+                              f"KXNBAGAME-{seg}BKNLAC")      # no YES team — dropped
+        games  = get_league_games(client, "nba")
+        assert len(games) == 1
+        assert games[0]["ticker"] == f"KXNBAGAME-{seg}BKNLAC-LAC"
+        assert (games[0]["home_team"], games[0]["away_team"]) == ("LAC", "BKN")
+        assert games[0]["match_key"] == f"{games[0]['date']}|BKN|LAC"
+
+
+class TestPriceCache:
+    def setup_method(self):
+        kalshi_client._price_cache.clear()
+
+    def _client(self):
+        client = MagicMock()
+        client.get_market.return_value.market = MagicMock(
+            yes_bid=80, yes_ask=82, no_bid=17, no_ask=19)
+        return client
+
+    def test_repeat_read_within_ttl_is_cached(self):
+        client = self._client()
+        first  = get_yes_no_prices("T-A", client)
+        first["yes_ask"] = -1
+        assert get_yes_no_prices("T-A", client)["yes_ask"] == 82
+        assert client.get_market.call_count == 1
+
+    def test_bust_forces_refetch(self):
+        client = self._client()
+        get_yes_no_prices("T-A", client)
+        kalshi_client.bust_price_cache("T-A")
+        get_yes_no_prices("T-A", client)
+        assert client.get_market.call_count == 2
+
+    def test_refresh_prices_batches_and_primes_cache(self):
+        client = self._client()
+        client.get_markets.return_value.markets = [MagicMock(
+            ticker="T-A", yes_bid=80, yes_ask=82, no_bid=17, no_ask=19)]
+        prices = kalshi_client.refresh_prices(client, ["T-A", "T-B"])
+        assert prices["T-A"]["yes_ask"] == 82
+        assert client.get_markets.call_count == 1
+        # T-B wasn't in the batch response, so it fell back to get_market
+        assert client.get_market.call_count == 1
+        get_yes_no_prices("T-A", client)
+        assert client.get_market.call_count == 1
+
+    def test_failed_batch_logs_and_falls_back(self, caplog):
+        client = self._client()
+        client.get_markets.side_effect = RuntimeError("503")
+        prices = kalshi_client.refresh_prices(client, ["T-A"])
+        assert prices["T-A"]["yes_ask"] == 82
+        assert "get_markets batch of 1 tickers failed" in caplog.text
+
+    def test_expired_quotes_evicted_on_write(self):
+        kalshi_client._price_cache["T-OLD"] = (time.monotonic() - kalshi_client.KALSHI_PRICE_TTL - 1, {})
+        get_yes_no_prices("T-A", self._client())
+        assert list(kalshi_client._price_cache) == ["T-A"]
+
+    def test_errors_not_cached(self):
+        client = self._client()
+        client.get_market.side_effect = RuntimeError("boom")
+        assert "error" in get_yes_no_prices("T-A", client)
+        assert "error" in get_yes_no_prices("T-A", client)
+        assert client.get_market.call_count == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# main.py  (league data cache — temp files)
+# ─────────────────────────────────────────────────────────────────────────────
+
+import main
+
+class TestLoadLeague:
+    ESPN   = [{"game_id": "1", "home_team": "LAC", "away_team": "BKN",
+               "date": "2026-02-25", "time": "2026-02-26T03:30Z"}]
+    KALSHI = [{"ticker": "T-BRK", "date": "2026-02-25",
+               "home_team": "BRK", "away_team": "LAC"}]
+
+    @pytest.fixture(autouse=True)
+    def _files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(main, "_LOADED", {})
+        monkeypatch.setattr(main, "_MERGED", {})
+        for name, games in (("espn", self.ESPN), ("kalshi", self.KALSHI)):
+            (tmp_path / f"{name}_games_nba.json").write_text(json.dumps(games))
+        self.espn_path = tmp_path / "espn_games_nba.json"
+
+    def test_reused_until_file_changes(self):
+        espn, kalshi = main.load_league("nba")
+        assert main.load_league("nba")[0] is espn
+        merged = main.merge_league("nba", espn, kalshi)
+        assert main.merge_league("nba", espn, kalshi) is merged
+        assert list(merged["ticker"]) == ["T-BRK"]
+
+        st = self.espn_path.stat()
+        os.utime(self.espn_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        espn2, kalshi2 = main.load_league("nba")
+        assert espn2 is not espn and espn2 == espn
+        assert main.merge_league("nba", espn2, kalshi2) is not merged
+
+    def test_missing_file_raises(self):
+        self.espn_path.unlink()
+        with pytest.raises(FileNotFoundError):
+            main.load_league("nba")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])